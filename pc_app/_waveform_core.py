@@ -0,0 +1,118 @@
+"""
+Optional Compiled Waveform Core
+===============================
+Native-code kernels for the hottest waveform engine loops.
+
+The kernels are compiled with numba when it is installed. Without numba,
+NUMBA_AVAILABLE is False and waveform_engine keeps using its pure-Python
+implementation, so numba is never required.
+
+Install for large cycle counts:
+    pip install numba
+
+Functions:
+    - sample_last_start_wins: State of a set of steady blocks at each boundary
+
+Notes:
+    - Kernels are compiled with cache=True, so the one-off compile cost is
+      paid on first use after installation, not on every start
+    - Results are identical to waveform_engine.state_last_start_wins
+    - A binary search finds each time's latest-starting candidate, and a
+      running maximum of block ends stops the backward scan once no earlier
+      block can cover the time, so times in gaps do not rescan every block
+"""
+
+from typing import List, Tuple
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+# True when the compiled kernels can be used
+NUMBA_AVAILABLE = njit is not None
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True)
+    def _sample_kernel(starts, ends, max_end, states, last_started, times):
+        """
+        Sample last-start-wins states at sorted times.
+
+        ``starts``/``ends``/``states`` describe the blocks sorted by start time
+        (stable, so blocks with equal starts keep their list order), and
+        ``max_end[j]`` is the latest end among blocks 0..j. For each time,
+        ``last_started`` holds the index of the last block starting at or
+        before it; candidates are scanned from there backwards, and within a
+        group of equal starts the earliest block covering the time wins. The
+        scan stops as soon as no earlier block can still cover the time.
+        """
+        out = np.zeros(times.shape[0], dtype=np.int64)
+
+        for k in range(times.shape[0]):
+            t = times[k]
+            j = last_started[k]
+            while j >= 0 and max_end[j] > t:
+                # Group of blocks sharing the start time starts[j]
+                group_start = j
+                while group_start > 0 and starts[group_start - 1] == starts[j]:
+                    group_start -= 1
+
+                found = False
+                for q in range(group_start, j + 1):
+                    if ends[q] > t:
+                        out[k] = states[q]
+                        found = True
+                        break
+                if found:
+                    break
+                j = group_start - 1
+
+        return out
+
+
+def sample_last_start_wins(steady_blocks: List[Tuple[float, float, int]], times: List[float]) -> List[int]:
+    """
+    Compute the last-start-wins state of ``steady_blocks`` at every time.
+
+    Args:
+        steady_blocks (List[Tuple[float, float, int]] | np.ndarray): (start, end, state)
+            blocks, or a record array with "s", "e" and "st" fields
+        times (List[float]): Sorted, duplicate-free sample times
+
+    Returns:
+        List[int]: State at each time (0 where no block covers it)
+
+    Raises:
+        RuntimeError: If numba is not installed (check NUMBA_AVAILABLE first)
+
+    Example:
+        >>> sample_last_start_wins([(0.0, 100.0, 1), (50.0, 150.0, 0)], [0.0, 75.0, 200.0])
+        [1, 0, 0]
+    """
+    if not NUMBA_AVAILABLE:
+        raise RuntimeError("numba not installed. Run: pip install numba")
+
+    if isinstance(steady_blocks, np.ndarray):
+        # Packed records: the fields are already contiguous typed columns
+        all_starts = steady_blocks["s"]
+        all_ends = steady_blocks["e"]
+        all_states = steady_blocks["st"]
+    else:
+        blocks = np.array(steady_blocks, dtype=np.float64).reshape(-1, 3)
+        all_starts, all_ends, all_states = blocks[:, 0], blocks[:, 1], blocks[:, 2]
+    order = np.argsort(all_starts, kind="stable")
+    starts = all_starts[order]
+    ends = all_ends[order]
+    states = all_states[order].astype(np.int64)
+    times = np.asarray(times, dtype=np.float64)
+
+    # Latest end so far (bounds the backward scan) and, per time, the last
+    # block starting at or before it (binary search)
+    max_end = np.maximum.accumulate(ends) if len(ends) else ends
+    last_started = np.searchsorted(starts, times, side="right") - 1
+
+    return _sample_kernel(starts, ends, max_end, states, last_started, times).tolist()
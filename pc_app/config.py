@@ -78,7 +78,7 @@ DEFAULT_ENABLED_POSITIONS = 3
 # ===========================
 
 # Default filenames
-DEFAULT_PICO_FILENAME = "profile.json"
+DEFAULT_PICO_FILENAME = "profile.bin"
 
 # File extensions
 PROFILE_FILE_EXTENSION = ".json"
@@ -0,0 +1,210 @@
+"""
+Pico Event Stream Module
+========================
+Compiles a Profile into the binary GPIO event stream run by the Pico firmware.
+
+The Pico used to receive the JSON profile and expand it into timed GPIO
+edges on every RUN (clean each waveform, shift it per position, sort and
+group the edges). This module does that work once on the PC and packs the
+result into a compact blob that the firmware only has to read and dispatch.
+
+Functions:
+    - build_event_stream: Expand a profile into (t_ms, set_mask, clr_mask) events
+    - pack_event_stream: Serialize events into the binary blob sent with PUT_BIN
+
+Constants:
+    - EVENT_STREAM_MAGIC: First four bytes of every blob
+    - EVENT_STREAM_HEADER: struct format of the blob header
+    - EVENT_STREAM_RECORD: struct format of one event record
+    - MAX_GPIO: Highest GPIO number the RP2040 exposes
+
+Binary Layout (little-endian):
+    header: magic b"PBEV", u32 event count, u32 mask of all GPIOs used
+    record: i32 t_ms, u32 set_mask, u32 clr_mask (one per distinct time)
+
+Notes:
+    - Expansion matches the firmware's _clean_points/_build_events exactly:
+      times are rounded to whole ms, every waveform starts LOW at t=0,
+      and among edges at the same time and GPIO the HIGH edge wins
+    - set_mask and clr_mask of a record never share a bit
+    - Times are signed because a negative DUT offset can shift edges
+      before the start of the run (the firmware fires those immediately)
+"""
+
+import struct
+from typing import Dict, Iterable, List, Tuple
+
+from models import Profile
+
+
+# ----------------------------
+# Binary Format
+# ----------------------------
+EVENT_STREAM_MAGIC = b"PBEV"
+EVENT_STREAM_HEADER = struct.Struct("<4sII")
+EVENT_STREAM_RECORD = struct.Struct("<iII")
+
+# GPIO0..GPIO29 fit in the RP2040's 32-bit SIO registers
+MAX_GPIO = 29
+
+
+# ----------------------------
+# Event Expansion
+# ----------------------------
+
+def _clean_points(points: Iterable) -> List[Tuple[int, int]]:
+    """
+    Round, sort and compact step points the way the firmware does.
+
+    Args:
+        points (Iterable): (time_ms, state) pairs; malformed entries are skipped
+
+    Returns:
+        List[Tuple[int, int]]: Points with whole-ms times and 0/1 states,
+                               one per state change, starting at t=0
+    """
+    pts = []
+    for it in points:
+        if not isinstance(it, (list, tuple)) or len(it) != 2:
+            continue
+        pts.append((int(round(float(it[0]))), 1 if int(it[1]) else 0))
+    pts.sort()
+
+    cleaned = []
+    last = None
+    for t, s in pts:
+        if s != last:
+            cleaned.append((t, s))
+            last = s
+    if not cleaned:
+        cleaned = [(0, 0)]
+    if cleaned[0][0] > 0:
+        cleaned.insert(0, (0, 0))
+    return cleaned
+
+
+def _gpio_bit(gpio: int) -> int:
+    """
+    Return the register mask bit of a GPIO number.
+
+    Raises:
+        ValueError: If the GPIO is outside 0..MAX_GPIO
+    """
+    g = int(gpio)
+    if g < 0 or g > MAX_GPIO:
+        raise ValueError(f"Invalid GPIO: {g} (must be 0-{MAX_GPIO})")
+    return 1 << g
+
+
+def build_event_stream(profile: Profile) -> Tuple[List[Tuple[int, int, int]], int]:
+    """
+    Expand a profile into the GPIO events the Pico executes.
+
+    Each enabled position replays the isolator waveform shifted by
+    ``index * row_delay_ms`` and the DUT waveform additionally shifted by
+    its ``dut_offset_ms``; enabled auxiliary outputs replay their own
+    waveform unshifted. All edges are then grouped by time.
+
+    Args:
+        profile (Profile): Built profile (see ProfileBuilderApp._build_profile_object)
+
+    Returns:
+        Tuple[List[Tuple[int, int, int]], int]:
+            - (t_ms, set_mask, clr_mask) per distinct time, sorted by time
+            - Mask of every GPIO the events drive
+
+    Raises:
+        ValueError: If no position is enabled or a GPIO is out of range
+
+    Example:
+        >>> events, used = build_event_stream(profile)
+        >>> events[:2]
+        [(0, 0, 12), (100, 4, 0)]
+    """
+    enabled = [p for p in profile.positions if p.enabled]
+    if not enabled:
+        raise ValueError("No positions enabled")
+
+    row_delay_ms = int(round(float(profile.row_delay_ms)))
+    iso_pts = _clean_points(profile.isolator_waveform_points)
+    dut_pts = _clean_points(profile.dut_waveform_points)
+
+    # (t_ms, gpio bit, state); sorting puts a GPIO's LOW edge before its HIGH
+    # edge at the same time, so the HIGH edge wins as it does on the Pico
+    edges = []
+    for idx, p in enumerate(enabled):
+        base_shift = idx * row_delay_ms
+        dut_shift = base_shift + int(round(float(p.dut_offset_ms)))
+        iso_bit = _gpio_bit(p.isolator_gpio)
+        dut_bit = _gpio_bit(p.dut_gpio)
+        edges.extend((t + base_shift, iso_bit, s) for t, s in iso_pts)
+        edges.extend((t + dut_shift, dut_bit, s) for t, s in dut_pts)
+
+    aux_waveforms: Dict[str, list] = profile.auxiliary_waveforms or {}
+    for aux in profile.auxiliary_outputs or []:
+        if not aux.enabled or not aux.name or aux.gpio is None:
+            continue
+        aux_waveform = aux_waveforms.get(aux.name)
+        if aux_waveform:
+            aux_bit = _gpio_bit(aux.gpio)
+            edges.extend((t, aux_bit, s) for t, s in _clean_points(aux_waveform))
+
+    edges.sort()
+
+    # Collapse each time's edges into one pair of disjoint register masks
+    events = []
+    used = 0
+    i = 0
+    n = len(edges)
+    while i < n:
+        t = edges[i][0]
+        set_mask = 0
+        clr_mask = 0
+        while i < n and edges[i][0] == t:
+            _, bit, s = edges[i]
+            if s:
+                set_mask |= bit
+                clr_mask &= ~bit
+            else:
+                clr_mask |= bit
+                set_mask &= ~bit
+            i += 1
+        used |= set_mask | clr_mask
+        events.append((t, set_mask, clr_mask))
+    return events, used
+
+
+# ----------------------------
+# Serialization
+# ----------------------------
+
+def pack_event_stream(events: List[Tuple[int, int, int]], used_mask: int) -> bytearray:
+    """
+    Serialize events into the binary blob stored on the Pico.
+
+    The blob is allocated once at its final size and every record is
+    packed in place, so no per-event bytes objects are created or joined.
+
+    Args:
+        events (List[Tuple[int, int, int]]): (t_ms, set_mask, clr_mask) records
+        used_mask (int): Mask of every GPIO the events drive
+
+    Returns:
+        bytearray: Header followed by one fixed-size record per event
+
+    Example:
+        >>> blob = pack_event_stream(*build_event_stream(profile))
+        >>> bytes(blob[:4])
+        b'PBEV'
+    """
+    header_size = EVENT_STREAM_HEADER.size
+    record_size = EVENT_STREAM_RECORD.size
+    buf = bytearray(header_size + len(events) * record_size)
+    EVENT_STREAM_HEADER.pack_into(buf, 0, EVENT_STREAM_MAGIC, len(events), used_mask)
+
+    pack_into = EVENT_STREAM_RECORD.pack_into
+    offset = header_size
+    for t, set_mask, clr_mask in events:
+        pack_into(buf, offset, t, set_mask, clr_mask)
+        offset += record_size
+    return buf
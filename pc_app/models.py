@@ -11,11 +11,13 @@ Classes:
 Constants:
     - UNIT_TO_MS: Time unit conversion factors
     - EVENTS: List of all available waveform event types
+    - EVENTS_SET: Frozenset of EVENTS for fast membership tests
+    - AUX_EVENT_SUFFIXES: Name suffixes of auxiliary output events
     - Event classification sets for waveform generation
 """
 
-from dataclasses import dataclass, asdict
-from typing import List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
 
 
 # ----------------------------
@@ -47,6 +49,12 @@ EVENTS = [
     "Cycle Delay",         # Delay between cycles (isolator and DUT both LOW)
 ]
 
+# Hashed copy of EVENTS for O(1) membership tests
+EVENTS_SET = frozenset(EVENTS)
+
+# Auxiliary output events are named "{output name} On" / "{output name} Off"
+AUX_EVENT_SUFFIXES = (" On", " Off")
+
 
 # ----------------------------
 # Event Classification Sets
@@ -79,10 +87,111 @@ DUT_RISE = {"DUT Rise Time"}
 DUT_FALL = {"DUT Fall Time"}
 
 
+# ----------------------------
+# Profile JSON Decoding
+# ----------------------------
+# Each model class declares the JSON fields it reads as a {key: type} schema.
+# _decode_fields() validates and converts all of them in a single pass and
+# reports failures with the field's path in the document
+# (e.g. "blocks[1].scheduled_events[0].start must be a number, got 'abc'").
+
+_TYPE_NAMES = {bool: "a boolean", int: "an integer", float: "a number", str: "a string", list: "a list"}
+
+
+def _decode_fields(d: dict, schema: Dict[str, type], defaults: dict, path: str) -> dict:
+    """
+    Validate and convert one JSON object against a declarative schema.
+    
+    Args:
+        d (dict): The JSON object to decode
+        schema (Dict[str, type]): Expected type per key; ``list`` values must
+                                  already be lists, other types are converted
+        defaults (dict): Value used for every schema key missing from ``d``
+        path (str): Location of ``d`` in the document, used in error messages
+    
+    Returns:
+        dict: Converted values for every key in ``schema``
+    
+    Raises:
+        ValueError: If ``d`` is not an object or a value has the wrong type
+    
+    Example:
+        >>> _decode_fields({"start": "5"}, {"start": float}, {"start": 0.0}, "event")
+        {'start': 5.0}
+    """
+    if not isinstance(d, dict):
+        raise ValueError(f"{path or 'profile'} must be an object")
+    
+    out = {}
+    for key, typ in schema.items():
+        value = d.get(key, defaults[key])
+        if typ is list:
+            if not isinstance(value, list):
+                raise ValueError(f"{path}.{key} must be a list" if path else f"{key} must be a list")
+            out[key] = value
+            continue
+        try:
+            out[key] = typ(value)
+        except (TypeError, ValueError):
+            where = f"{path}.{key}" if path else key
+            raise ValueError(f"{where} must be {_TYPE_NAMES[typ]}, got {value!r}") from None
+    return out
+
+
+# ----------------------------
+# Profile JSON Encoding
+# ----------------------------
+# Each model's to_dict() is generated from its _FIELD_NAMES when the class is
+# defined: the body is a single dict display, so a call does no iteration or
+# introspection over fields (unlike dataclasses.asdict, which also deep-copies).
+
+def _generate_to_dict(*model_lists: str):
+    """
+    Class decorator that adds a generated ``to_dict()`` method.
+    
+    Args:
+        *model_lists (str): Fields holding lists of models; their items are
+                            converted with their own to_dict(). All other
+                            values are passed through as-is, so the result
+                            shares them with the instance and must not be mutated.
+    
+    Returns:
+        Callable: Decorator returning the class with ``to_dict`` set
+    
+    Example:
+        For Block, ``_generate_to_dict("scheduled_events")`` generates::
+        
+            def to_dict(self):
+                return {"block_name": self.block_name,
+                        "scheduled_events": [x.to_dict() for x in self.scheduled_events],
+                        "cycles": self.cycles}
+    """
+    def decorate(cls):
+        items = []
+        for name in cls._FIELD_NAMES:
+            if name in model_lists:
+                items.append(f"{name!r}: [x.to_dict() for x in self.{name}]")
+            else:
+                items.append(f"{name!r}: self.{name}")
+        namespace = {}
+        exec(f"def to_dict(self):\n    return {{{', '.join(items)}}}\n", namespace)
+        
+        to_dict = namespace["to_dict"]
+        to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+        to_dict.__doc__ = (
+            f"Convert to the JSON object for this {cls.__name__}: the same dict as "
+            "dataclasses.asdict(), in field order, without deep-copying values."
+        )
+        cls.to_dict = to_dict
+        return cls
+    return decorate
+
+
 # ----------------------------
 # Data Classes
 # ----------------------------
 
+@_generate_to_dict()
 @dataclass
 class PositionConfig:
     """
@@ -109,7 +218,35 @@ class PositionConfig:
     dut_gpio: int
     dut_offset_ms: float = 0.0  # Default: no offset
 
+    # Field names in declaration order, i.e. the keys written by to_dict()
+    _FIELD_NAMES = ("position", "enabled", "isolator_gpio", "dut_gpio", "dut_offset_ms")
 
+    # JSON fields read by from_dict() ("position" is implied by list order)
+    _SCHEMA = {"enabled": bool, "isolator_gpio": int, "dut_gpio": int, "dut_offset_ms": float}
+
+    @classmethod
+    def from_dict(cls, d: dict, index: int) -> "PositionConfig":
+        """
+        Build a PositionConfig from a parsed profile JSON object.
+        
+        Missing keys fall back to the GUI defaults for the position at
+        ``index`` (isolator GPIO ``index + 1``, DUT GPIO ``21 + index``).
+        
+        Args:
+            d (dict): One entry of the profile's "positions" list
+            index (int): Zero-based index of the entry in that list
+        
+        Returns:
+            PositionConfig: The decoded position
+        
+        Raises:
+            ValueError: If the entry is not an object or a value has the wrong type
+        """
+        defaults = {"enabled": False, "isolator_gpio": index + 1, "dut_gpio": 21 + index, "dut_offset_ms": 0.0}
+        return cls(position=index + 1, **_decode_fields(d, cls._SCHEMA, defaults, f"positions[{index}]"))
+
+
+@_generate_to_dict()
 @dataclass
 class ScheduledEvent:
     """
@@ -131,7 +268,39 @@ class ScheduledEvent:
     start: float
     duration: float
 
+    # Field names in declaration order, i.e. the keys written by to_dict()
+    _FIELD_NAMES = ("event", "start", "duration")
+
+    # JSON fields read by from_dict()
+    _SCHEMA = {"event": str, "start": float, "duration": float}
+    _DEFAULTS = {"event": EVENTS[0], "start": 0.0, "duration": 0.0}
+
+    @classmethod
+    def from_dict(cls, d: dict, path: str = "scheduled_events[0]") -> "ScheduledEvent":
+        """
+        Build a ScheduledEvent from a parsed profile JSON object.
+        
+        Auxiliary output events ("{name} On" / "{name} Off") load as-is;
+        any other name not in EVENTS falls back to the first event type.
+        
+        Args:
+            d (dict): One entry of a "scheduled_events" list
+            path (str): Location of the entry in the document (for error messages)
+        
+        Returns:
+            ScheduledEvent: The decoded event (missing keys use defaults)
+        
+        Raises:
+            ValueError: If the entry is not an object or a value has the wrong type
+        """
+        fields = _decode_fields(d, cls._SCHEMA, cls._DEFAULTS, path)
+        event = fields["event"]
+        if event not in EVENTS_SET and not event.endswith(AUX_EVENT_SUFFIXES):
+            fields["event"] = EVENTS[0]
+        return cls(**fields)
 
+
+@_generate_to_dict("scheduled_events")
 @dataclass
 class Block:
     """
@@ -174,7 +343,39 @@ class Block:
     scheduled_events: List[ScheduledEvent]
     cycles: int
 
+    # Field names in declaration order, i.e. the keys written by to_dict()
+    _FIELD_NAMES = ("block_name", "scheduled_events", "cycles")
+
+    # JSON fields read by from_dict()
+    _SCHEMA = {"block_name": str, "scheduled_events": list, "cycles": int}
+
+    @classmethod
+    def from_dict(cls, d: dict, index: int) -> "Block":
+        """
+        Build a Block (and its events) from a parsed profile JSON object.
+        
+        Args:
+            d (dict): One entry of the profile's "blocks" list
+            index (int): Zero-based index of the entry (used for the default name)
+        
+        Returns:
+            Block: The decoded block
+        
+        Raises:
+            ValueError: If the block or one of its events has the wrong structure
+                        (the message names the offending path, e.g. "blocks[0].cycles")
+        """
+        path = f"blocks[{index}]"
+        defaults = {"block_name": f"Block {index + 1}", "scheduled_events": [], "cycles": 1}
+        fields = _decode_fields(d, cls._SCHEMA, defaults, path)
+        fields["scheduled_events"] = [
+            ScheduledEvent.from_dict(ev, f"{path}.scheduled_events[{j}]")
+            for j, ev in enumerate(fields["scheduled_events"])
+        ]
+        return cls(**fields)
 
+
+@_generate_to_dict()
 @dataclass
 class AuxiliaryOutput:
     """
@@ -211,7 +412,32 @@ class AuxiliaryOutput:
     enabled: bool = True
     always_on: bool = False
 
+    # Field names in declaration order, i.e. the keys written by to_dict()
+    _FIELD_NAMES = ("name", "gpio", "enabled", "always_on")
+
+    # JSON fields read by from_dict()
+    _SCHEMA = {"name": str, "gpio": int, "enabled": bool, "always_on": bool}
+    _DEFAULTS = {"name": "Aux", "gpio": 15, "enabled": True, "always_on": False}
 
+    @classmethod
+    def from_dict(cls, d: dict, path: str = "auxiliary_outputs[0]") -> "AuxiliaryOutput":
+        """
+        Build an AuxiliaryOutput from a parsed profile JSON object.
+        
+        Args:
+            d (dict): One entry of the profile's "auxiliary_outputs" list
+            path (str): Location of the entry in the document (for error messages)
+        
+        Returns:
+            AuxiliaryOutput: The decoded output (missing keys use defaults)
+        
+        Raises:
+            ValueError: If the entry is not an object or a value has the wrong type
+        """
+        return cls(**_decode_fields(d, cls._SCHEMA, cls._DEFAULTS, path))
+
+
+@_generate_to_dict("blocks", "positions", "auxiliary_outputs")
 @dataclass
 class Profile:
     """
@@ -286,3 +512,84 @@ class Profile:
             self.auxiliary_outputs = []
         if self.auxiliary_waveforms is None:
             self.auxiliary_waveforms = {}
+
+    # Field names in declaration order, i.e. the keys written by to_dict()
+    _FIELD_NAMES = (
+        "profile_name", "waveform_time_units", "blocks", "isolator_waveform_points", "dut_waveform_points",
+        "row_delay_ms", "positions", "auxiliary_outputs", "auxiliary_waveforms",
+    )
+
+    # Top-level JSON fields read by from_dict() ("blocks", the legacy schedule
+    # and the auxiliary lists are handled separately)
+    _SCHEMA = {"profile_name": str, "waveform_time_units": str, "row_delay_ms": float, "positions": list}
+    _DEFAULTS = {"profile_name": "Profile", "waveform_time_units": "ms", "row_delay_ms": 0.0, "positions": []}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Profile":
+        """
+        Decode a parsed profile JSON document into typed model objects.
+        
+        All structural checks and type conversions happen here, in one pass
+        driven by each class's ``_SCHEMA``, so callers can work with
+        attributes instead of chains of ``dict.get()`` lookups. Errors name
+        the offending location, e.g. "blocks[1].scheduled_events[0].start".
+        
+        Backward Compatibility:
+            Old single-schedule files (top-level "scheduled_events" + "cycles"
+            instead of "blocks") are converted to a single "Main Block".
+        
+        Args:
+            data (dict): The parsed JSON document
+        
+        Returns:
+            Profile: The decoded profile
+        
+        Raises:
+            ValueError: If the document structure or a value's type is invalid
+        
+        Example:
+            >>> prof = Profile.from_dict(json.loads(text))
+            >>> prof.blocks[0].scheduled_events[0].event
+            'Isolator On'
+        """
+        fields = _decode_fields(data, cls._SCHEMA, cls._DEFAULTS, "")
+        
+        if "blocks" in data:
+            blocks_data = data["blocks"]
+            if not isinstance(blocks_data, list):
+                raise ValueError("blocks must be a list")
+            if not blocks_data:
+                raise ValueError("blocks list cannot be empty")
+            blocks = [Block.from_dict(b, i) for i, b in enumerate(blocks_data)]
+        else:
+            # Old format: single schedule + cycles
+            legacy = _decode_fields(
+                data, {"scheduled_events": list, "cycles": int}, {"scheduled_events": [], "cycles": 1}, ""
+            )
+            blocks = [Block(
+                block_name="Main Block",
+                scheduled_events=[
+                    ScheduledEvent.from_dict(ev, f"scheduled_events[{j}]")
+                    for j, ev in enumerate(legacy["scheduled_events"])
+                ],
+                cycles=legacy["cycles"],
+            )]
+        
+        # Auxiliary outputs are optional; anything but a list is ignored
+        aux_list = data.get("auxiliary_outputs", [])
+        if not isinstance(aux_list, list):
+            aux_list = []
+        
+        return cls(
+            profile_name=fields["profile_name"],
+            waveform_time_units=fields["waveform_time_units"],
+            blocks=blocks,
+            isolator_waveform_points=data.get("isolator_waveform_points", []),
+            dut_waveform_points=data.get("dut_waveform_points", []),
+            row_delay_ms=fields["row_delay_ms"],
+            positions=[PositionConfig.from_dict(p, i) for i, p in enumerate(fields["positions"])],
+            auxiliary_outputs=[
+                AuxiliaryOutput.from_dict(a, f"auxiliary_outputs[{i}]") for i, a in enumerate(aux_list)
+            ],
+            auxiliary_waveforms=data.get("auxiliary_waveforms", {}),
+        )
@@ -10,6 +10,8 @@ Protocol Overview:
     PC -> Pico Commands:
         PING\n                           - Check if Pico is responsive
         PUT <filename> <nbytes>\n<data>  - Upload JSON profile to Pico
+        PUT_BIN <filename> <nbytes>\n     - Upload binary event stream to Pico;
+                                           <data> follows the Pico's READY
         RUN <filename>\n                 - Execute a profile
         PAUSE\n                          - Pause execution
         RESUME\n                         - Resume execution
@@ -18,6 +20,8 @@ Protocol Overview:
     Pico -> PC Responses:
         PONG\n                  - Response to PING
         OK PUT\n                - Profile uploaded successfully
+        READY\n                 - PUT_BIN may send its payload now
+        OK PUT_BIN\n            - Event stream uploaded successfully
         OK RUN\n                - Profile execution started
         OK PAUSE\n              - Execution paused
         OK RESUME\n             - Execution resumed
@@ -29,20 +33,18 @@ Classes:
     PicoLink: Manages serial connection and command protocol with Pico
 
 Notes:
-    - Uses pyserial library for serial communication
+    - Uses pyserial library for serial communication (imported on first connect)
     - Implements thread-safe command execution
+    - A background reader thread owns all serial reads and queues each line,
+      so writes (e.g. STOP during a run) never wait behind a blocking read
     - Automatically handles Pico soft reset on connect
     - Supports timeout-based response waiting
 """
 
+import queue
 import threading
 import time
-from typing import Optional
-
-try:
-    import serial
-except ImportError:
-    serial = None
+from typing import Optional, Union
 
 
 class PicoLink:
@@ -64,6 +66,7 @@ class PicoLink:
         port (str): The COM port name (e.g., "COM3" on Windows, "/dev/ttyACM0" on Linux)
         baud (int): The baud rate for serial communication (default: 115200)
         last_filename (str): The last filename used in PUT command (for convenience)
+        PUT_CHUNK_SIZE (int): Bytes per serial write when uploading a profile
     
     Example:
         >>> pico = PicoLink()
@@ -79,6 +82,8 @@ class PicoLink:
         >>> pico.close()
     """
     
+    PUT_CHUNK_SIZE = 4096
+    
     def __init__(self):
         """
         Initialize a new PicoLink instance.
@@ -90,7 +95,15 @@ class PicoLink:
         self.port = ""                              # COM port name
         self.baud = 115200                          # Baud rate
         self.last_filename = "profile.json"         # Default filename
-        self._lock = threading.Lock()               # Thread-safe command execution
+        self._lock = threading.Lock()               # One command/reply exchange at a time
+        
+        # Lines from the reader thread: replies to the command currently
+        # holding the lock, and everything else (DONE/ERR status of a run)
+        self._rx_q: "queue.Queue[str]" = queue.Queue()
+        self._status_q: "queue.Queue[str]" = queue.Queue()
+        self._awaiting_reply = False                # Next line answers the current command
+        self._multi_reply = False                   # Keep routing replies until released (PING)
+        self._reader: Optional[threading.Thread] = None
     
     def connect(self, port: str, baud: int = 115200, timeout: float = 1.0):
         """
@@ -102,6 +115,7 @@ class PicoLink:
         3. Waits for the Pico to reboot (USB serial triggers reset)
         4. Performs a soft reset to ensure main.py is running
         5. Clears serial buffers
+        6. Starts the background reader thread
         
         Args:
             port (str): COM port name (e.g., "COM3", "/dev/ttyACM0")
@@ -120,8 +134,10 @@ class PicoLink:
             - The 1.5s delay is necessary for the Pico to boot and run main.py
             - Soft reset (Ctrl-D) ensures the Pico is in the correct state
         """
-        # Check if pyserial is available
-        if serial is None:
+        # Import pyserial on first use so startup does not pay for it
+        try:
+            import serial
+        except ImportError:
             raise RuntimeError("pyserial not installed. Run: pip install pyserial")
         
         # Close any existing connection
@@ -155,6 +171,12 @@ class PicoLink:
             self.ser.reset_output_buffer()
         except Exception:
             pass  # Ignore buffer clear errors
+        
+        # Start the reader thread for this port (it exits when the port closes)
+        self._rx_q = queue.Queue()
+        self._status_q = queue.Queue()
+        self._reader = threading.Thread(target=self._reader_loop, args=(self.ser,), daemon=True)
+        self._reader.start()
     
     def close(self):
         """
@@ -186,32 +208,101 @@ class PicoLink:
         if not self.ser or not self.ser.is_open:
             raise RuntimeError("Not connected to Pico. Click Connect first.")
     
+    def _reader_loop(self, ser):
+        """
+        Background thread: read lines from ``ser`` and queue them.
+        
+        While a command is waiting for its reply (``_awaiting_reply``), the
+        next line goes to the reply queue read by _readline() and the flag is
+        cleared, so each command gets exactly one line. DONE lines, and any
+        later line (e.g. the ERR that follows "OK RUN" when the profile
+        cannot be loaded), go to the status queue read by wait_done() and
+        poll_status(). PING sets ``_multi_reply`` to keep collecting lines
+        until PONG, skipping boot messages.
+        
+        Args:
+            ser (serial.Serial): The port to read; the loop ends when it is
+                                 closed or a read fails
+        
+        Note:
+            An ERR from a run that arrives exactly while another command is
+            waiting for its reply is taken as that reply.
+        """
+        while ser.is_open:
+            try:
+                raw = ser.readline()
+            except Exception:
+                break  # Port closed or device unplugged
+            
+            if not raw:
+                continue
+            
+            # Decode with error handling
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            
+            if self._awaiting_reply and not line.startswith("DONE"):
+                if not self._multi_reply:
+                    self._awaiting_reply = False
+                self._rx_q.put(line)
+            else:
+                self._status_q.put(line)
+    
     def _readline(self) -> str:
         """
-        Read a line from the Pico with error handling.
+        Wait for the next reply line queued by the reader thread.
         
         Returns:
             str: The line read from the Pico (stripped of whitespace),
-                 or empty string if timeout or read error
+                 or empty string on timeout
         
         Note:
-            - Uses the timeout specified in connect()
-            - Handles decode errors gracefully
-            - Strips whitespace from the result
+            - Waits up to the timeout specified in connect()
+            - Only valid while holding the lock with _awaiting_reply set
         """
         self._require()
         
-        # Read a line (blocking up to timeout)
-        line = self.ser.readline()
-        
-        if not line:
+        try:
+            return self._rx_q.get(timeout=self.ser.timeout)
+        except queue.Empty:
             return ""
-        
-        # Decode with error handling
+    
+    def _clear_input(self):
+        """
+        Discard unread input: the serial input buffer and both line queues.
+        """
         try:
-            return line.decode("utf-8", errors="replace").strip()
+            self.ser.reset_input_buffer()
         except Exception:
-            return str(line)  # Fallback to string representation
+            pass
+        for q in (self._rx_q, self._status_q):
+            while True:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    break
+    
+    def _command(self, data: bytes) -> str:
+        """
+        Send one command and wait for its reply.
+        
+        Args:
+            data (bytes): The complete command, including the trailing newline
+        
+        Returns:
+            str: The reply line, or empty string on timeout
+        
+        Note:
+            Must be called with the lock held.
+        """
+        self._awaiting_reply = True
+        try:
+            self.ser.write(data)
+            self.ser.flush()
+            return self._readline()
+        finally:
+            self._awaiting_reply = False
     
     def _soft_reset(self):
         """
@@ -275,59 +366,74 @@ class PicoLink:
         
         with self._lock:
             # Clear any stale data
+            self._clear_input()
             try:
-                self.ser.reset_input_buffer()
                 self.ser.reset_output_buffer()
             except Exception:
                 pass
             
-            # Send PING command
+            self._multi_reply = True
+            self._awaiting_reply = True
+            try:
+                return self._ping_locked()
+            finally:
+                self._awaiting_reply = False
+                self._multi_reply = False
+    
+    def _ping_locked(self) -> str:
+        """
+        PING exchange used by ping(); called with the lock held.
+        
+        Returns:
+            str: "PONG" if successful, or error message starting with "ERR"
+        """
+        # Send PING command
+        self.ser.write(b"PING\n")
+        self.ser.flush()
+        
+        # Wait for PONG response (up to 5 seconds)
+        deadline = time.monotonic() + 5.0
+        last = ""
+        
+        while time.monotonic() < deadline:
+            line = self._readline()
+            if not line:
+                continue
+            
+            last = line
+            if line == "PONG":
+                return line
+        
+        # If we got no response at all, try a soft reset and retry
+        if not last:
+            self._soft_reset()
+            time.sleep(1.0)
+            
+            # Clear buffers again
+            self._clear_input()
+            try:
+                self.ser.reset_output_buffer()
+            except Exception:
+                pass
+            
+            # Retry PING once
             self.ser.write(b"PING\n")
             self.ser.flush()
             
-            # Wait for PONG response (up to 5 seconds)
-            deadline = time.monotonic() + 5.0
-            last = ""
-            
-            while time.monotonic() < deadline:
+            retry_deadline = time.monotonic() + 3.0
+            while time.monotonic() < retry_deadline:
                 line = self._readline()
                 if not line:
                     continue
-                
-                last = line
                 if line == "PONG":
                     return line
             
-            # If we got no response at all, try a soft reset and retry
-            if not last:
-                self._soft_reset()
-                time.sleep(1.0)
-                
-                # Clear buffers again
-                try:
-                    self.ser.reset_input_buffer()
-                    self.ser.reset_output_buffer()
-                except Exception:
-                    pass
-                
-                # Retry PING once
-                self.ser.write(b"PING\n")
-                self.ser.flush()
-                
-                retry_deadline = time.monotonic() + 3.0
-                while time.monotonic() < retry_deadline:
-                    line = self._readline()
-                    if not line:
-                        continue
-                    if line == "PONG":
-                        return line
-                
-                return "ERR no response after reset"
-            
-            # Got a response but it wasn't PONG
-            return last or "ERR no response"
+            return "ERR no response after reset"
+        
+        # Got a response but it wasn't PONG
+        return last or "ERR no response"
     
-    def put_json(self, filename: str, json_text: str) -> str:
+    def put_json(self, filename: str, json_text: Union[str, bytes]) -> str:
         """
         Upload a JSON profile to the Pico's filesystem.
         
@@ -340,7 +446,9 @@ class PicoLink:
         
         Args:
             filename (str): Name to save the file as on the Pico (e.g., "profile.json")
-            json_text (str): The JSON content to upload
+            json_text (Union[str, bytes]): The JSON content to upload; bytes
+                                           (e.g. from orjson.dumps) are sent
+                                           as-is, text is UTF-8 encoded first
         
         Returns:
             str: Response from Pico ("OK PUT" if successful, or error message)
@@ -358,28 +466,136 @@ class PicoLink:
             - Thread-safe (uses internal lock)
             - Stores filename for later use with run()
             - Timeout depends on data size and baud rate
+            - Delegates to put_json_bytes()
+        """
+        if isinstance(json_text, str):
+            json_text = json_text.encode("utf-8")
+        return self.put_json_bytes(filename, json_text)
+    
+    def put_json_bytes(self, filename: str, data: bytes) -> str:
+        """
+        Upload already-encoded JSON bytes to the Pico's filesystem.
+        
+        Same protocol as put_json(), but takes the UTF-8 payload directly
+        (e.g. from orjson.dumps) so no intermediate str is materialized.
+        A profile that fits in one PUT_CHUNK_SIZE write is sent together with
+        its header in a single write; larger ones send the header and then
+        PUT_CHUNK_SIZE slices of a memoryview over the payload, so the
+        payload itself is never copied.
+        
+        Args:
+            filename (str): Name to save the file as on the Pico (e.g., "profile.json")
+            data (bytes): UTF-8 encoded JSON content to upload
+        
+        Returns:
+            str: Response from Pico ("OK PUT" if successful, or error message)
+        
+        Raises:
+            RuntimeError: If not connected to the Pico
+        
+        Example:
+            >>> response = pico.put_json_bytes("myprofile.json", orjson.dumps(profile))
+        
+        Note:
+            - Thread-safe (uses internal lock)
+            - Stores filename for later use with run()
+        """
+        return self._put("PUT", filename, data)
+    
+    def put_bin(self, filename: str, data: bytes) -> str:
+        """
+        Upload a binary event stream to the Pico's filesystem.
+        
+        The blob (see event_stream.pack_event_stream) is stored verbatim and
+        runs with run() just like a JSON profile: the firmware recognizes
+        the format by its magic bytes, so no expansion happens on the Pico.
+        
+        Command format:
+            PUT_BIN <filename> <nbytes>\n
+            (wait for READY\n from the Pico)
+            <data>
+        
+        Args:
+            filename (str): Name to save the file as on the Pico (e.g., "profile.bin")
+            data (bytes): Packed event stream (bytes or bytearray)
+        
+        Returns:
+            str: Response from Pico ("OK PUT_BIN" if successful, or error message)
+        
+        Raises:
+            RuntimeError: If not connected to the Pico
+        
+        Example:
+            >>> blob = pack_event_stream(*build_event_stream(profile))
+            >>> response = pico.put_bin("profile.bin", blob)
+        
+        Note:
+            - Thread-safe (uses internal lock)
+            - Stores filename for later use with run()
+        """
+        return self._put("PUT_BIN", filename, data)
+    
+    def _put(self, command: str, filename: str, data: bytes) -> str:
+        """
+        Send an upload command header followed by its payload.
+        
+        For PUT_BIN the payload is only sent after the Pico answers the
+        header with "READY": binary data may contain 0x03, which USB CDC
+        turns into a KeyboardInterrupt as soon as it arrives unless the
+        firmware has disabled Ctrl-C first. JSON text (PUT) never contains
+        0x03, so it is sent right behind its header.
+        
+        Args:
+            command (str): "PUT" or "PUT_BIN"
+            filename (str): Name to save the file as on the Pico
+            data (bytes): Payload to upload
+        
+        Returns:
+            str: Response line from the Pico (the error line if PUT_BIN was
+                 not acknowledged with READY)
+        
+        Raises:
+            RuntimeError: If not connected to the Pico
         """
         self._require()
         
-        # Encode JSON text to bytes
-        data = json_text.encode("utf-8")
+        # Construct command header
+        header = f"{command} {filename} {len(data)}\n".encode("utf-8")
         
-        # Construct PUT command header
-        header = f"PUT {filename} {len(data)}\n".encode("utf-8")
+        handshake = command == "PUT_BIN"
         
         with self._lock:
-            # Send header
-            self.ser.write(header)
-            
-            # Send JSON data
-            self.ser.write(data)
-            self.ser.flush()
-            
-            # Remember this filename for convenience
-            self.last_filename = filename
-            
-            # Read response (should be "OK PUT" or error)
-            return self._readline()
+            self._awaiting_reply = True
+            try:
+                if handshake:
+                    # Wait until the Pico has disabled Ctrl-C before sending data
+                    self.ser.write(header)
+                    self.ser.flush()
+                    ready = self._readline()
+                    if ready != "READY":
+                        return ready or "ERR no READY for PUT_BIN"
+                    self._awaiting_reply = True
+                    header = b""
+                
+                if len(header) + len(data) <= self.PUT_CHUNK_SIZE:
+                    # Small payload: one write (the copy is at most one chunk)
+                    self.ser.write(b"".join((header, data)))
+                else:
+                    # Large payload: header, then zero-copy chunks of the data
+                    if header:
+                        self.ser.write(header)
+                    view = memoryview(data)
+                    for i in range(0, len(view), self.PUT_CHUNK_SIZE):
+                        self.ser.write(view[i:i + self.PUT_CHUNK_SIZE])
+                self.ser.flush()
+                
+                # Remember this filename for convenience
+                self.last_filename = filename
+                
+                # Read response (should be "OK PUT"/"OK PUT_BIN" or error)
+                return self._readline()
+            finally:
+                self._awaiting_reply = False
     
     def run(self, filename: Optional[str] = None) -> str:
         """
@@ -410,7 +626,9 @@ class PicoLink:
         
         Note:
             - Thread-safe (uses internal lock)
-            - Does not wait for completion (use wait_done() for that)
+            - Does not wait for completion (use wait_done() or poll_status() for that)
+            - Discards unread input first, so a late DONE from a previous
+              run cannot be mistaken for the RUN response
             - The Pico will begin executing immediately after OK RUN
         """
         self._require()
@@ -419,12 +637,11 @@ class PicoLink:
         fn = filename or self.last_filename
         
         with self._lock:
-            # Send RUN command
-            self.ser.write(f"RUN {fn}\n".encode("utf-8"))
-            self.ser.flush()
+            # Drop stale status lines (e.g. the DONE of a run whose wait was cancelled)
+            self._clear_input()
             
-            # Read response (should be "OK RUN" or error)
-            return self._readline()
+            # Send RUN command; response should be "OK RUN" or error
+            return self._command(f"RUN {fn}\n".encode("utf-8"))
     
     def wait_done(self, timeout_s: float = 120.0) -> str:
         """
@@ -455,27 +672,27 @@ class PicoLink:
             ...     print(f"Error: {result}")
         
         Note:
-            - Thread-safe (uses internal lock)
+            - Thread-safe; reads the status queue, so it never holds the lock
             - Blocks the calling thread until completion or timeout
             - Should be called from a background thread to avoid GUI freezing
         """
         self._require()
         
         # Record start time for timeout checking
-        t0 = time.time()
+        deadline = time.monotonic() + timeout_s
         
         while True:
             # Check for timeout
-            if (time.time() - t0) > timeout_s:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 return "ERR timeout waiting for DONE"
             
-            # Read a line from the Pico
-            with self._lock:
-                line = self._readline()
-            
-            # Skip empty lines
-            if not line:
-                continue
+            # Block until the next status line or the deadline (no lock, no
+            # periodic wake-ups while the run is in progress)
+            try:
+                line = self._status_q.get(timeout=remaining)
+            except queue.Empty:
+                return "ERR timeout waiting for DONE"
             
             # Check for completion messages
             if line.startswith("DONE"):
@@ -485,6 +702,37 @@ class PicoLink:
             
             # Other messages are ignored (progress updates, debug info, etc.)
     
+    def poll_status(self, timeout_s: float = 0.2) -> str:
+        """
+        Wait briefly for one status line from the Pico.
+        
+        Unlike wait_done(), this returns after at most ``timeout_s``, so a
+        caller can check for cancellation between polls. Status lines are
+        queued by the reader thread, so a poll never takes the lock and
+        stop()/pause() are never blocked by it.
+        
+        Args:
+            timeout_s (float): Maximum time to wait for data in seconds (default: 0.2)
+        
+        Returns:
+            str: The line read (stripped), or empty string if nothing arrived
+        
+        Raises:
+            RuntimeError: If not connected to the Pico
+        
+        Example:
+            >>> while not cancelled:
+            ...     line = pico.poll_status(timeout_s=0.2)
+            ...     if line.startswith(("DONE", "ERR")):
+            ...         break
+        """
+        self._require()
+        
+        try:
+            return self._status_q.get(timeout=timeout_s)
+        except queue.Empty:
+            return ""
+    
     def stop(self) -> str:
         """
         Stop profile execution on the Pico.
@@ -514,9 +762,7 @@ class PicoLink:
         self._require()
         
         with self._lock:
-            self.ser.write(b"STOP\n")
-            self.ser.flush()
-            return self._readline()
+            return self._command(b"STOP\n")
     
     def pause(self) -> str:
         """
@@ -550,9 +796,7 @@ class PicoLink:
         self._require()
         
         with self._lock:
-            self.ser.write(b"PAUSE\n")
-            self.ser.flush()
-            return self._readline()
+            return self._command(b"PAUSE\n")
     
     def resume(self) -> str:
         """
@@ -585,6 +829,4 @@ class PicoLink:
         self._require()
         
         with self._lock:
-            self.ser.write(b"RESUME\n")
-            self.ser.flush()
-            return self._readline()
+            return self._command(b"RESUME\n")
@@ -9,6 +9,7 @@ Functions:
     - normalize_step_points: Normalize and compact step waveform points
 """
 
+from operator import itemgetter
 from typing import List, Tuple
 from models import UNIT_TO_MS
 
@@ -122,7 +123,7 @@ def normalize_step_points(points: List[Tuple[float, int]]) -> List[Tuple[float,
         return []
     
     # Step 1: Sort by time
-    pts = sorted(points, key=lambda x: x[0])
+    pts = sorted(points, key=itemgetter(0))
     
     # Step 2: Merge duplicate timestamps (keep last state)
     merged: List[Tuple[float, int]] = []
@@ -133,19 +134,17 @@ def normalize_step_points(points: List[Tuple[float, int]]) -> List[Tuple[float,
             merged.append((t, s))
     
     # Step 3: Remove redundant intermediate points (keep only state changes and endpoints)
-    compact: List[Tuple[float, int]] = []
-    for i, (t, s) in enumerate(merged):
-        if not compact:
-            # Always keep the first point
-            compact.append((t, s))
-            continue
-        
-        is_last = (i == len(merged) - 1)
-        
-        # Keep this point if the state changes OR if it's the last point
-        if s != compact[-1][1] or is_last:
+    compact: List[Tuple[float, int]] = [merged[0]]  # Always keep the first point
+    for t, s in merged:
+        # Keep this point only if the state changes
+        if s != compact[-1][1]:
             compact.append((t, s))
     
+    # Anchor the end of the waveform unless the last point was already kept
+    # (its state is the last kept state, as it did not change)
+    if len(merged) > 1 and compact[-1][0] != merged[-1][0]:
+        compact.append((merged[-1][0], compact[-1][1]))
+    
     # Step 4: Ensure at least 2 points for plotting
     if len(compact) == 1:
         compact.append((compact[0][0], compact[0][1]))
@@ -18,21 +18,39 @@ Functions:
     - build_digital_step_waveform: Generate digital step waveform from events
     - apply_directed_ramps_on_display: Add visual ramps to display waveform
     - build_waveforms_from_schedule: Main entry point for waveform generation
+    - WaveformBuf: Waveform as parallel time/value arrays for the preview
     - shift_series: Apply time offset to display waveform points
     - shift_step_points: Apply time offset to digital waveform points
     - build_preview_channels: Generate multi-channel preview data
 """
 
+import heapq
+from dataclasses import dataclass
+from operator import itemgetter
 from typing import List, Dict, Tuple
+
+import numpy as np
 # ----------------------------
 # Local Module Imports
 # ----------------------------
 from models import (
     ScheduledEvent, PositionConfig, Block,
     ISO_ON_STEADY, ISO_OFF_STEADY, DUT_ON_STEADY, DUT_OFF_STEADY,
-    ISO_RISE, ISO_FALL, DUT_RISE, DUT_FALL, EVENTS
+    ISO_RISE, ISO_FALL, DUT_RISE, DUT_FALL, EVENTS_SET, AUX_EVENT_SUFFIXES
 )
 from utils import to_ms, merge_duplicate_times_keep_last, normalize_step_points
+from _waveform_core import NUMBA_AVAILABLE, sample_last_start_wins
+
+# Minimum boundaries x blocks for which the compiled kernel is used (when numba
+# is installed); below this the Python sweep is faster than converting to arrays
+JIT_MIN_WORK = 20_000
+
+# Packed steady block record: 17 bytes per block instead of a 3-tuple of objects
+STEADY_BLOCK_DTYPE = np.dtype([("s", "f8"), ("e", "f8"), ("st", "i1")])
+
+# Sort key for (time, ...) tuples. A C-level key instead of a lambda; sorting
+# on the time alone (not the whole tuple) keeps equal times in input order
+_BY_TIME = itemgetter(0)
 
 
 # ----------------------------
@@ -97,12 +115,15 @@ def build_digital_step_waveform(
     ensuring that state changes are captured.
     
     Args:
-        steady_blocks (List[Tuple[float, float, int]]): List of (start, end, state)
-                                                         tuples defining when the
-                                                         signal should be HIGH (1)
-                                                         or LOW (0)
-        boundaries (List[float]): List of time points where the waveform should
-                                  be sampled (includes all event start/end times)
+        steady_blocks (List[Tuple[float, float, int]] | np.ndarray): (start, end,
+                                                         state) tuples, or
+                                                         STEADY_BLOCK_DTYPE
+                                                         records, defining when
+                                                         the signal should be
+                                                         HIGH (1) or LOW (0)
+        boundaries (List[float] | np.ndarray): Time points where the waveform
+                                  should be sampled (includes all event
+                                  start/end times); need not be sorted or unique
     
     Returns:
         List[Tuple[float, int]]: Normalized waveform as (time, state) tuples,
@@ -117,28 +138,73 @@ def build_digital_step_waveform(
     Note:
         - Returns a minimal waveform with at least 2 points
         - Automatically handles overlapping blocks using last-start-wins logic
+          (same result as calling state_last_start_wins at every boundary)
+        - Runs as a single sweep over the sorted boundaries in
+          O((B + K) log K) for B boundaries and K blocks, instead of
+          scanning every block at every boundary
+        - Large inputs use the numba kernel from _waveform_core when numba
+          is installed (same results)
     """
     # Handle edge case: no boundaries provided
-    if not boundaries:
+    if len(boundaries) == 0:
         return [(0.0, 0), (0.0, 0)]
     
-    # Remove duplicates and sort boundaries
-    b = sorted(set(boundaries))
+    # Remove duplicates and sort boundaries (np.unique sorts in C)
+    b_arr = np.unique(np.asarray(boundaries, dtype=np.float64))
+    b = b_arr.tolist()
     
-    # Sample the state at each boundary time
-    pts: List[Tuple[float, int]] = []
-    for t in b:
-        state = state_last_start_wins(t, steady_blocks, default=0)
-        pts.append((t, state))
+    # Sample the state at each boundary time (natively for large inputs if numba is installed)
+    if NUMBA_AVAILABLE and len(steady_blocks) * len(b) >= JIT_MIN_WORK:
+        states = sample_last_start_wins(steady_blocks, b_arr)
+    else:
+        if isinstance(steady_blocks, np.ndarray):
+            steady_blocks = steady_blocks.tolist()
+        states = _sample_states_sweep(steady_blocks, b)
+    pts: List[Tuple[float, int]] = list(zip(b, states))
     
     # Add final point at the last boundary (ensures proper waveform termination)
-    final_state = state_last_start_wins(b[-1], steady_blocks, default=0)
-    pts.append((b[-1], final_state))
+    pts.append((b[-1], pts[-1][1]))
     
     # Normalize to remove redundant points
     return normalize_step_points(pts)
 
 
+def _sample_states_sweep(steady_blocks: List[Tuple[float, float, int]], times: List[float]) -> List[int]:
+    """
+    Pure-Python last-start-wins sampling at sorted, duplicate-free times.
+    
+    Args:
+        steady_blocks (List[Tuple[float, float, int]]): (start, end, state) blocks
+        times (List[float]): Sorted, duplicate-free sample times
+    
+    Returns:
+        List[int]: State at each time (0 where no block covers it)
+    """
+    # Blocks in order of start time; they become candidates as the sweep reaches them
+    block_starts = [blk[0] for blk in steady_blocks]
+    order = sorted(range(len(steady_blocks)), key=block_starts.__getitem__)
+    n_blocks = len(order)
+    next_block = 0
+    
+    # Max-heap of started blocks keyed on (latest start, earliest list index),
+    # matching state_last_start_wins' tie-breaking. Blocks that have ended are
+    # dropped lazily when they reach the top: times only increase, so an
+    # ended block never becomes active again.
+    started: List[Tuple[float, int, float, int]] = []  # (-start, index, end, state)
+    
+    states: List[int] = []
+    for t in times:
+        while next_block < n_blocks and steady_blocks[order[next_block]][0] <= t:
+            i = order[next_block]
+            start, end, state = steady_blocks[i]
+            heapq.heappush(started, (-start, i, end, state))
+            next_block += 1
+        while started and started[0][2] <= t:
+            heapq.heappop(started)
+        states.append(started[0][3] if started else 0)
+    return states
+
+
 # ----------------------------
 # Display Waveform with Ramps
 # ----------------------------
@@ -176,60 +242,130 @@ def apply_directed_ramps_on_display(
     
     Note:
         - Ramps are purely for visualization; hardware uses digital step waveform
-        - Multiple ramps at the same location are processed in order
-        - Duplicate times are merged, keeping the last value
+        - Ramp-ups are applied before ramp-downs, each in order of start time;
+          a ramp replaces every point inside its closed window [start, end],
+          including endpoints of ramps applied before it
+        - Duplicate times are merged as points are emitted, keeping the last value
+        - Computed in a single sweep: a point is kept unless a ramp applied
+          after the point was created covers its time, which avoids
+          rebuilding and re-sorting the waveform once per ramp
     """
     if not base_step_points:
         return []
     
-    # Convert integer states to float values for display
+    # Convert integer states to float values for display (duplicate times are
+    # merged as points are emitted below, so no separate pass is needed)
     display = [(t, float(s)) for t, s in base_step_points]
-    display = sorted(display, key=lambda x: x[0])
-    display = merge_duplicate_times_keep_last(display)
-    
-    def overlay_ramp(ramp_start: float, ramp_end: float, v0: float, v1: float):
-        """
-        Overlay a single ramp onto the display waveform.
-        
-        This inner function removes any points within the ramp window and
-        adds the ramp endpoints, creating a linear transition.
-        """
-        nonlocal display
-        
-        # Skip invalid ramps
-        if ramp_end <= ramp_start:
-            return
-        
-        # Keep only points outside the ramp window
-        new_disp: List[Tuple[float, float]] = []
-        for t, v in display:
-            if t < ramp_start or t > ramp_end:
-                new_disp.append((t, v))
+    display.sort(key=_BY_TIME)
+    
+    # Ramps in application order: all ramp-ups (0.0 -> 1.0), then all
+    # ramp-downs (1.0 -> 0.0), each sorted by start time. Invalid ramps are skipped.
+    ramps: List[Tuple[float, float, float, float]] = [
+        (rs, re, 0.0, 1.0) for rs, re in sorted(ramp_up_windows, key=_BY_TIME) if re > rs
+    ]
+    ramps += [
+        (rs, re, 1.0, 0.0) for rs, re in sorted(ramp_down_windows, key=_BY_TIME) if re > rs
+    ]
+    
+    # Candidate points tagged with the ramp that created them (-1 = base waveform)
+    candidates: List[Tuple[float, float, int]] = [(t, v, -1) for t, v in display]
+    for k, (rs, re, v0, v1) in enumerate(ramps):
+        candidates.append((rs, v0, k))
+        candidates.append((re, v1, k))
+    candidates.sort(key=_BY_TIME)
+    
+    # Sweep the candidates in time order, tracking the latest-applied ramp
+    # whose window covers the current time (max-heap on ramp index; ramps
+    # that ended before the current time are dropped lazily)
+    ramp_starts = [r[0] for r in ramps]
+    by_start = sorted(range(len(ramps)), key=ramp_starts.__getitem__)
+    next_ramp = 0
+    covering: List[Tuple[int, float]] = []  # (-ramp index, ramp end)
+    
+    result: List[Tuple[float, float]] = []
+    for t, v, created_by in candidates:
+        while next_ramp < len(by_start) and ramps[by_start[next_ramp]][0] <= t:
+            k = by_start[next_ramp]
+            heapq.heappush(covering, (-k, ramps[k][1]))
+            next_ramp += 1
+        while covering and covering[0][1] < t:
+            heapq.heappop(covering)
         
-        # Add ramp start and end points
-        new_disp.append((ramp_start, v0))
-        new_disp.append((ramp_end, v1))
-        
-        # Re-sort and merge duplicates
-        new_disp = sorted(new_disp, key=lambda x: x[0])
-        new_disp = merge_duplicate_times_keep_last(new_disp)
-        display = new_disp
+        # Dropped if a later ramp's window contains this point
+        if covering and -covering[0][0] > created_by:
+            continue
+        # Merge duplicate times, keeping the last value (as merge_duplicate_times_keep_last)
+        if result and abs(result[-1][0] - t) < 1e-9:
+            result[-1] = (t, v)
+        else:
+            result.append((t, v))
     
-    # Apply all ramp-up transitions (0.0 -> 1.0)
-    for rs, re in sorted(ramp_up_windows, key=lambda x: x[0]):
-        overlay_ramp(rs, re, 0.0, 1.0)
+    return result
+
+
+def _expand_steady_blocks(base: List[Tuple[float, float, tuple, bool]], shifts: List[float]) -> np.ndarray:
+    """
+    Repeat classified steady blocks once per cycle into a packed record array.
+    
+    Same blocks, in the same order, as _expand_cycles(), but built with one
+    broadcast add per field instead of a tuple per block and cycle.
     
-    # Apply all ramp-down transitions (1.0 -> 0.0)
-    for rs, re in sorted(ramp_down_windows, key=lambda x: x[0]):
-        overlay_ramp(rs, re, 1.0, 0.0)
+    Args:
+        base (List[Tuple[float, float, tuple, bool]]): (start, end, (state,),
+            kept_in_final_cycle) per event
+        shifts (List[float]): Time shift of each cycle in milliseconds
     
-    return display
+    Returns:
+        np.ndarray: 1-D array of STEADY_BLOCK_DTYPE records
+    """
+    starts = np.array([b[0] for b in base], dtype=np.float64)
+    ends = np.array([b[1] for b in base], dtype=np.float64)
+    shift_col = np.asarray(shifts, dtype=np.float64)[:, None]
+    
+    blocks = np.empty((len(shifts), len(base)), dtype=STEADY_BLOCK_DTYPE)
+    blocks["s"] = starts + shift_col
+    blocks["e"] = ends + shift_col
+    blocks["st"] = [b[2][0] for b in base]
+    
+    # Drop the blocks skipped in the final cycle; row-major order keeps
+    # cycle-by-cycle, base-order sequencing
+    keep = np.ones(blocks.shape, dtype=bool)
+    keep[-1] = [b[3] for b in base]
+    return blocks[keep]
 
 
 # ----------------------------
 # Main Waveform Building Function
 # ----------------------------
 
+def _expand_cycles(base: List[Tuple[float, float, tuple, bool]], shifts: List[float]) -> List[tuple]:
+    """
+    Repeat classified base events once per cycle.
+    
+    Args:
+        base (List[Tuple[float, float, tuple, bool]]): (start, end, extra,
+            kept_in_final_cycle) per event; ``extra`` is appended to each
+            output tuple (e.g. ``(state,)`` for steady blocks)
+        shifts (List[float]): Time shift of each cycle in milliseconds
+    
+    Returns:
+        List[tuple]: (start + shift, end + shift, *extra) for every cycle and
+                     event, cycle by cycle in base order
+    """
+    # Preallocate the full size and trim the final-cycle skips at the end
+    out: List[tuple] = [None] * (len(base) * len(shifts))
+    k = 0
+    last = len(shifts) - 1
+    for c, shift in enumerate(shifts):
+        for s0, e0, extra, in_last in base:
+            if c == last and not in_last:
+                continue
+            out[k] = (s0 + shift, e0 + shift) + extra
+            k += 1
+    del out[k:]
+    return out
+
+
 def build_waveforms_from_schedule(
     schedule: List[ScheduledEvent],
     unit: str,
@@ -295,15 +431,15 @@ def build_waveforms_from_schedule(
     if cycles < 1:
         raise ValueError("Cycles must be >= 1")
     
-    # Step 1: Convert all events to milliseconds and collect boundaries
+    # Step 1: Convert all events to milliseconds and find the cycle length
     base_events_ms: List[Tuple[str, float, float]] = []  # (event_name, start_ms, end_ms)
-    base_boundaries: List[float] = [0.0]  # Always include t=0
+    cycle_length_ms = 0.0  # Latest event end in one cycle (cycles start at t=0)
     
     for ev in schedule:
         # Validate event type (allow auxiliary events ending with " On" or " Off")
-        if ev.event not in EVENTS:
+        if ev.event not in EVENTS_SET:
             # Check if this is an auxiliary event
-            if not (ev.event.endswith(" On") or ev.event.endswith(" Off")):
+            if not ev.event.endswith(AUX_EVENT_SUFFIXES):
                 raise ValueError(f"Unknown event '{ev.event}'")
         
         # Validate timing parameters
@@ -317,72 +453,77 @@ def build_waveforms_from_schedule(
         e = s + to_ms(ev.duration, unit)
         
         base_events_ms.append((ev.event, s, e))
-        base_boundaries.extend([s, e])
-    
-    # Calculate the length of a single cycle
-    cycle_length_ms = max(base_boundaries) if base_boundaries else 0.0
-    
-    # Step 2: Initialize data structures for waveform building
-    boundaries: List[float] = [0.0]  # All time boundaries across all cycles
-    
-    # Steady-state blocks: (start, end, state)
-    iso_steady_blocks: List[Tuple[float, float, int]] = []
-    dut_steady_blocks: List[Tuple[float, float, int]] = []
+        
+        # Track the length of a single cycle (end >= start, as duration >= 0)
+        if e > cycle_length_ms:
+            cycle_length_ms = e
+    
+    # Step 2: Collect all time boundaries across all cycles in one array
+    # (cycle shift x event start/end), dropping Cycle Delay in the final cycle
+    base_times = np.array([t for _, s, e in base_events_ms for t in (s, e)], dtype=np.float64)
+    cycle_times = np.arange(cycles, dtype=np.float64)[:, None] * cycle_length_ms + base_times
+    keep = np.ones(cycle_times.shape, dtype=bool)
+    for i, (event, _, _) in enumerate(base_events_ms):
+        if event == "Cycle Delay":
+            keep[-1, 2 * i:2 * i + 2] = False
+    boundaries = np.concatenate(([0.0], cycle_times[keep]))
+    
+    # Step 3: Classify each base event once: (start, end, extra, kept in final cycle)
+    # Cycle Delay is skipped in the final cycle
+    iso_steady_base: List[Tuple[float, float, tuple, bool]] = []
+    dut_steady_base: List[Tuple[float, float, tuple, bool]] = []
+    iso_up_base: List[Tuple[float, float, tuple, bool]] = []
+    iso_down_base: List[Tuple[float, float, tuple, bool]] = []
+    dut_up_base: List[Tuple[float, float, tuple, bool]] = []
+    dut_down_base: List[Tuple[float, float, tuple, bool]] = []
+    
+    for event, s0, e0 in base_events_ms:
+        in_last = event != "Cycle Delay"
+        
+        # Isolator events
+        if event in ISO_ON_STEADY:
+            iso_steady_base.append((s0, e0, (1,), in_last))  # HIGH
+        if event in ISO_OFF_STEADY:
+            iso_steady_base.append((s0, e0, (0,), in_last))  # LOW
+        
+        # DUT events
+        if event in DUT_ON_STEADY:
+            dut_steady_base.append((s0, e0, (1,), in_last))  # HIGH
+        if event in DUT_OFF_STEADY:
+            dut_steady_base.append((s0, e0, (0,), in_last))  # LOW
+        
+        # Ramp events (for display only)
+        if event in ISO_RISE:
+            iso_up_base.append((s0, e0, (), in_last))
+        if event in ISO_FALL:
+            iso_down_base.append((s0, e0, (), in_last))
+        if event in DUT_RISE:
+            dut_up_base.append((s0, e0, (), in_last))
+        if event in DUT_FALL:
+            dut_down_base.append((s0, e0, (), in_last))
+    
+    # Step 4: Expand events across all cycles
+    shifts = [c * cycle_length_ms for c in range(cycles)]
+    
+    # Steady-state blocks: packed (start, end, state) records
+    iso_steady_blocks = _expand_steady_blocks(iso_steady_base, shifts)
+    dut_steady_blocks = _expand_steady_blocks(dut_steady_base, shifts)
     
     # Ramp windows: (start, end)
-    iso_ramp_up: List[Tuple[float, float]] = []
-    iso_ramp_down: List[Tuple[float, float]] = []
-    dut_ramp_up: List[Tuple[float, float]] = []
-    dut_ramp_down: List[Tuple[float, float]] = []
-    
-    # Step 3: Expand events across all cycles
-    for c in range(cycles):
-        # Calculate time shift for this cycle
-        shift = c * cycle_length_ms
-        
-        for event, s0, e0 in base_events_ms:
-            # Special case: skip Cycle Delay in the final cycle
-            if event == "Cycle Delay" and c == cycles - 1:
-                continue
-            
-            # Apply cycle time shift
-            s = s0 + shift
-            e = e0 + shift
-            boundaries.extend([s, e])
-            
-            # Classify event and add to appropriate collections
-            
-            # Isolator events
-            if event in ISO_ON_STEADY:
-                iso_steady_blocks.append((s, e, 1))  # HIGH
-            if event in ISO_OFF_STEADY:
-                iso_steady_blocks.append((s, e, 0))  # LOW
-            
-            # DUT events
-            if event in DUT_ON_STEADY:
-                dut_steady_blocks.append((s, e, 1))  # HIGH
-            if event in DUT_OFF_STEADY:
-                dut_steady_blocks.append((s, e, 0))  # LOW
-            
-            # Ramp events (for display only)
-            if event in ISO_RISE:
-                iso_ramp_up.append((s, e))
-            if event in ISO_FALL:
-                iso_ramp_down.append((s, e))
-            if event in DUT_RISE:
-                dut_ramp_up.append((s, e))
-            if event in DUT_FALL:
-                dut_ramp_down.append((s, e))
-    
-    # Step 4: Build digital step waveforms
+    iso_ramp_up = _expand_cycles(iso_up_base, shifts)
+    iso_ramp_down = _expand_cycles(iso_down_base, shifts)
+    dut_ramp_up = _expand_cycles(dut_up_base, shifts)
+    dut_ramp_down = _expand_cycles(dut_down_base, shifts)
+    
+    # Step 5: Build digital step waveforms
     iso_digital = build_digital_step_waveform(iso_steady_blocks, boundaries)
     dut_digital = build_digital_step_waveform(dut_steady_blocks, boundaries)
     
-    # Step 5: Check if ramps exist
+    # Step 6: Check if ramps exist
     iso_has_ramps = (len(iso_ramp_up) + len(iso_ramp_down)) > 0
     dut_has_ramps = (len(dut_ramp_up) + len(dut_ramp_down)) > 0
     
-    # Step 6: Build display waveforms with ramps
+    # Step 7: Build display waveforms with ramps
     iso_display = apply_directed_ramps_on_display(iso_digital, iso_ramp_up, iso_ramp_down)
     dut_display = apply_directed_ramps_on_display(dut_digital, dut_ramp_up, dut_ramp_down)
     
@@ -668,57 +809,99 @@ def build_waveforms_from_blocks(
 # Waveform Shifting Functions
 # ----------------------------
 
-def shift_series(points: List[Tuple[float, float]], shift_ms: float) -> Tuple[List[float], List[float]]:
+@dataclass
+class WaveformBuf:
+    """
+    Waveform stored as parallel NumPy arrays (struct-of-arrays).
+    
+    The engine builds waveforms as lists of (time, value) tuples, which is
+    convenient for export but costs a boxed Python object per point. For the
+    preview, where the same waveform is shifted once per enabled position, a
+    pair of flat arrays is far smaller and lets a shift be one vectorized add.
+    
+    Attributes:
+        t (np.ndarray): Point times in milliseconds (float64)
+        v (np.ndarray): Point values (float32 for display, int8 for digital)
+    
+    Example:
+        >>> buf = WaveformBuf.from_points([(0.0, 0), (10.0, 1)], np.int8)
+        >>> buf.t
+        array([ 0., 10.])
+    """
+    t: np.ndarray
+    v: np.ndarray
+
+    @classmethod
+    def from_points(cls, points: List[Tuple[float, float]], value_dtype=np.float32) -> "WaveformBuf":
+        """
+        Convert a list of (time, value) tuples into a WaveformBuf.
+        
+        Args:
+            points (List[Tuple[float, float]]): Waveform as (time, value) tuples
+            value_dtype: NumPy dtype for the values (default: float32)
+        
+        Returns:
+            WaveformBuf: The same waveform as two arrays
+        """
+        n = len(points)
+        t = np.fromiter((p[0] for p in points), dtype=np.float64, count=n)
+        v = np.fromiter((p[1] for p in points), dtype=value_dtype, count=n)
+        return cls(t, v)
+
+
+def shift_series(points, shift_ms: float) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Apply a time offset to display waveform points and separate into lists.
+    Apply a time offset to display waveform points and separate into arrays.
     
     This function shifts all time values by a constant offset and returns
-    separate lists for times and values, which is useful for plotting.
+    separate arrays for times and values, which is useful for plotting.
     
     Args:
-        points (List[Tuple[float, float]]): Waveform as (time, value) tuples
+        points (WaveformBuf | List[Tuple[float, float]]): Waveform to shift;
+            a list of (time, value) tuples is converted first
         shift_ms (float): Time offset to add to all points (in milliseconds)
     
     Returns:
-        Tuple[List[float], List[float]]: Separate lists of (times, values)
+        Tuple[np.ndarray, np.ndarray]: Separate arrays of (times, values).
+            The values array is shared with the input buffer, not copied.
     
     Example:
         >>> points = [(0.0, 0.0), (10.0, 1.0), (20.0, 0.0)]
         >>> times, values = shift_series(points, 50.0)
         >>> times
-        [50.0, 60.0, 70.0]
+        array([50., 60., 70.])
         >>> values
-        [0.0, 1.0, 0.0]
+        array([0., 1., 0.], dtype=float32)
     """
-    times = [t + shift_ms for t, _ in points]
-    values = [v for _, v in points]
-    return times, values
+    buf = points if isinstance(points, WaveformBuf) else WaveformBuf.from_points(points, np.float32)
+    return buf.t + shift_ms, buf.v
 
 
-def shift_step_points(points: List[Tuple[float, int]], shift_ms: float) -> Tuple[List[float], List[int]]:
+def shift_step_points(points, shift_ms: float) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Apply a time offset to digital waveform points and separate into lists.
+    Apply a time offset to digital waveform points and separate into arrays.
     
     Similar to shift_series but for digital (integer state) waveforms.
     
     Args:
-        points (List[Tuple[float, int]]): Waveform as (time, state) tuples
+        points (WaveformBuf | List[Tuple[float, int]]): Waveform to shift;
+            a list of (time, state) tuples is converted first
         shift_ms (float): Time offset to add to all points (in milliseconds)
     
     Returns:
-        Tuple[List[float], List[int]]: Separate lists of (times, states)
+        Tuple[np.ndarray, np.ndarray]: Separate arrays of (times, states).
+            The states array is shared with the input buffer, not copied.
     
     Example:
         >>> points = [(0.0, 0), (10.0, 1), (20.0, 0)]
         >>> times, states = shift_step_points(points, 50.0)
         >>> times
-        [50.0, 60.0, 70.0]
+        array([50., 60., 70.])
         >>> states
-        [0, 1, 0]
+        array([0, 1, 0], dtype=int8)
     """
-    times = [t + shift_ms for t, _ in points]
-    states = [s for _, s in points]
-    return times, states
+    buf = points if isinstance(points, WaveformBuf) else WaveformBuf.from_points(points, np.int8)
+    return buf.t + shift_ms, buf.v
 
 
 # ----------------------------
@@ -751,7 +934,7 @@ def build_preview_channels(
     Returns:
         Dict[str, Dict]: Dictionary mapping channel names to channel data.
                          Each channel has keys: "display_t", "display_v",
-                         "digital_t", "digital_v"
+                         "digital_t", "digital_v" (NumPy arrays)
     
     Example:
         >>> positions = [
@@ -768,6 +951,8 @@ def build_preview_channels(
         - Isolator waveforms are shifted by: position_index * row_delay_ms
         - DUT waveforms are shifted by: position_index * row_delay_ms + dut_offset_ms
         - Channel names include GPIO numbers for hardware reference
+        - Time arrays are row views of one 2-D array per base waveform, and
+          value arrays are shared between channels; do not modify them in place
     """
     # Filter to only enabled positions
     enabled = [p for p in positions if p.enabled]
@@ -777,34 +962,39 @@ def build_preview_channels(
     
     out: Dict[str, Dict] = {}
     
-    # Generate channels for each enabled position
+    # Convert each base waveform to arrays once; every channel is then just
+    # a time shift of these (the value arrays are shared)
+    iso_display = WaveformBuf.from_points(iso_display, np.float32)
+    dut_display = WaveformBuf.from_points(dut_display, np.float32)
+    iso_digital = WaveformBuf.from_points(iso_digital, np.int8)
+    dut_digital = WaveformBuf.from_points(dut_digital, np.int8)
+    
+    # Time shift of each position: row delay, plus the DUT offset for DUT channels
+    iso_shifts = np.arange(len(enabled), dtype=np.float64) * row_delay_ms
+    dut_shifts = iso_shifts + np.array([float(p.dut_offset_ms) for p in enabled])
+    
+    # Shift all positions at once: one 2-D array per waveform, one row per position
+    iso_disp_t = iso_display.t[None, :] + iso_shifts[:, None]
+    iso_dig_t = iso_digital.t[None, :] + iso_shifts[:, None]
+    dut_disp_t = dut_display.t[None, :] + dut_shifts[:, None]
+    dut_dig_t = dut_digital.t[None, :] + dut_shifts[:, None]
+    
+    # Each channel gets row views of the shifted arrays
     for idx, p in enumerate(enabled):
-        # Calculate base time shift for this position (row delay)
-        base_shift = idx * row_delay_ms
-        
-        # Generate isolator channel
-        t_iso_disp, v_iso_disp = shift_series(iso_display, base_shift)
-        t_iso_dig, v_iso_dig = shift_step_points(iso_digital, base_shift)
-        
         iso_channel_name = f"ISO P{p.position} (GPIO{p.isolator_gpio})"
         out[iso_channel_name] = {
-            "display_t": t_iso_disp,
-            "display_v": v_iso_disp,
-            "digital_t": t_iso_dig,
-            "digital_v": v_iso_dig,
+            "display_t": iso_disp_t[idx],
+            "display_v": iso_display.v,
+            "digital_t": iso_dig_t[idx],
+            "digital_v": iso_digital.v,
         }
         
-        # Generate DUT channel (with additional DUT-specific offset)
-        dut_shift = base_shift + float(p.dut_offset_ms)
-        t_dut_disp, v_dut_disp = shift_series(dut_display, dut_shift)
-        t_dut_dig, v_dut_dig = shift_step_points(dut_digital, dut_shift)
-        
         dut_channel_name = f"DUT P{p.position} (GPIO{p.dut_gpio})"
         out[dut_channel_name] = {
-            "display_t": t_dut_disp,
-            "display_v": v_dut_disp,
-            "digital_t": t_dut_dig,
-            "digital_v": v_dut_dig,
+            "display_t": dut_disp_t[idx],
+            "display_v": dut_display.v,
+            "digital_t": dut_dig_t[idx],
+            "digital_v": dut_digital.v,
         }
     
     return out
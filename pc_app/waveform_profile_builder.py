@@ -42,11 +42,15 @@ Date: January 2026
 # Standard Library Imports
 # ----------------------------
 import json
+import mmap
+import os
 import threading
 import queue
 import time
-from dataclasses import asdict
-from typing import List, Dict, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, List, Dict, Tuple, Optional
 
 # ----------------------------
 # Third-Party GUI Imports
@@ -59,12 +63,57 @@ from ttkbootstrap.constants import *
 from ttkbootstrap.widgets.scrolled import ScrolledFrame
 
 # ----------------------------
-# Matplotlib Imports (for waveform visualization)
+# Matplotlib (for waveform visualization) is imported lazily by
+# ProfileBuilderApp._init_preview_canvas() on the first preview
 # ----------------------------
-import matplotlib
-matplotlib.use("TkAgg")  # Use TkAgg backend for embedding in Tkinter
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
+
+# ----------------------------
+# Optional Fast JSON (falls back to stdlib json)
+# ----------------------------
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Files at least this large are memory-mapped for orjson instead of read into a bytes copy
+MMAP_MIN_BYTES = 1 << 20
+
+# Quiet period after the last setting change before the preview is rebuilt
+# (short enough to feel immediate, long enough to coalesce bursts of edits)
+REBUILD_DEBOUNCE_MS = 80
+
+
+def _load_json_file(path: str):
+    """
+    Read and parse a JSON file.
+    
+    With orjson, large files are parsed straight from a read-only memory
+    map (via a memoryview), so the file contents are never copied into a
+    Python bytes object. Small files, and the stdlib fallback, read the
+    file normally (both parsers decode UTF-8 bytes themselves).
+    
+    Args:
+        path (str): Path of the JSON file
+    
+    Returns:
+        The parsed JSON document
+    
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid JSON
+    """
+    with open(path, "rb") as f:
+        if orjson is None:
+            return json.loads(f.read())
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return orjson.loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                # The map cannot be closed while a view still exports it
+                view.release()
 
 # ----------------------------
 # Local Module Imports
@@ -75,6 +124,7 @@ from models import (
 )
 from waveform_engine import build_waveforms_from_schedule, build_waveforms_from_blocks, build_preview_channels
 from pico_serial import PicoLink
+from event_stream import build_event_stream, pack_event_stream
 
 
 
@@ -110,8 +160,8 @@ class ProfileBuilderApp(tb.Window):
     
     Attributes:
         num_positions (int): Number of test positions (default: 10)
-        default_isolator_gpios (List[int]): Default GPIO pins for isolators
-        default_dut_gpios (List[int]): Default GPIO pins for DUTs
+        default_isolator_gpios (Tuple[int, ...]): Default GPIO pins for isolators
+        default_dut_gpios (Tuple[int, ...]): Default GPIO pins for DUTs
         
         Profile configuration variables (tk.StringVar, tk.DoubleVar, etc.):
             - profile_name: Name of the current profile
@@ -136,10 +186,15 @@ class ProfileBuilderApp(tb.Window):
             - pico_port/pico_baud/pico_filename: Connection settings
             - pico_status: Status message for user display
             - _pico_q: Queue for background thread communication
+            - _pico_executor: Single worker running blocking serial commands
             - _pico_run_thread: Background execution thread
             - _pico_is_running/_pico_is_paused: Execution state flags
     """
     
+    # Bind tags shared by all schedule row widgets (bound once, see __init__)
+    _SCHEDULE_ENTRY_TAG = "ScheduleRowEntry"
+    _SCHEDULE_COMBO_TAG = "ScheduleRowCombobox"
+    
     def __init__(self):
         """
         Initialize the Profile Builder application.
@@ -153,7 +208,6 @@ class ProfileBuilderApp(tb.Window):
         6. Generates initial preview
         """
         # Load saved theme preference or use default
-        import os
         theme_file = os.path.join(os.path.dirname(__file__), ".theme_preference")
         saved_theme = "flatly"
         if os.path.exists(theme_file):
@@ -165,6 +219,7 @@ class ProfileBuilderApp(tb.Window):
         
         # Initialize the themed window
         super().__init__(themename=saved_theme)
+        self._saved_theme = saved_theme  # Theme on disk; rewritten on close only if changed
         self.title("Position Profile Builder")
         self.geometry("1450x900")
         
@@ -180,14 +235,20 @@ class ProfileBuilderApp(tb.Window):
         
         # Save theme on close
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
+        self.bind("<<PicoMsg>>", self._drain_pico_queue)  # Wakeup from Pico background threads
+        
+        # Schedule row edits rebuild the preview; bound once per tag instead of per row widget
+        self.bind_class(self._SCHEDULE_COMBO_TAG, "<<ComboboxSelected>>", lambda _e: self._rebuild_and_preview())
+        self.bind_class(self._SCHEDULE_ENTRY_TAG, "<FocusOut>", lambda _e: self._rebuild_and_preview())
+        self.bind_class(self._SCHEDULE_ENTRY_TAG, "<Return>", lambda _e: self._rebuild_and_preview())
         
         # ----------------------------
         # Position Configuration
         # ----------------------------
         self.num_positions = 10
         # Default GPIO mappings (1-10 for isolators, 21-30 for DUTs)
-        self.default_isolator_gpios = list(range(1, self.num_positions + 1))
-        self.default_dut_gpios = list(range(21, 21 + self.num_positions))
+        self.default_isolator_gpios = tuple(range(1, self.num_positions + 1))
+        self.default_dut_gpios = tuple(range(21, 21 + self.num_positions))
         
         # ----------------------------
         # Profile Settings (Tkinter Variables)
@@ -210,6 +271,8 @@ class ProfileBuilderApp(tb.Window):
         # ----------------------------
         # List of scheduled event rows: (event_var, start_var, duration_var, frame_widget)
         self.schedule_rows: List[Tuple[tk.StringVar, tk.DoubleVar, tk.DoubleVar, tb.Frame]] = []
+        # Hidden row frames kept for reuse instead of being destroyed
+        self._schedule_row_pool: List[tb.Frame] = []
         
         # ----------------------------
         # Waveform Data (computed by waveform_engine)
@@ -230,6 +293,24 @@ class ProfileBuilderApp(tb.Window):
         self.total_length_ms = 0.0
         self.block_end_times: List[float] = []  # Time points where blocks end
         
+        # Inputs the waveforms above were built from: (unit, blocks, auxiliary outputs).
+        # Position-only changes leave it equal, so the waveforms are reused.
+        self._wave_key: Optional[tuple] = None
+        
+        # Channel labels the preview axes are currently configured for
+        # (ticks, title and layout are only recomputed when this changes)
+        self._last_channel_labels: Tuple[str, ...] = ()
+        
+        # Preview artists reused across rebuilds: one trace per channel label
+        # (updated with set_data) and the current block-boundary markers
+        self._channel_lines: Dict[str, Any] = {}
+        self._boundary_lines: List[Any] = []
+        
+        # Rendered figure without the traces, and the axis limits it was drawn
+        # with; data-only updates with unchanged limits are blitted over it
+        self._preview_bg = None
+        self._preview_limits: Optional[tuple] = None
+        
         # ----------------------------
         # Position Configuration Variables
         # ----------------------------
@@ -252,35 +333,51 @@ class ProfileBuilderApp(tb.Window):
         self.pico_port = tk.StringVar(value="/dev/ttyACM0")   # COM port (Linux default)
         self.pico_baud = tk.IntVar(value=115200)               # Baud rate
         self.pico_status = tk.StringVar(value="Pico: Disconnected")  # Status message
-        self.pico_filename = tk.StringVar(value="profile.json")      # Filename on Pico
+        self.pico_filename = tk.StringVar(value="profile.bin")       # Filename on Pico
         
         # Background thread management for non-blocking execution
         self._pico_q = queue.Queue()                          # Queue for thread communication
+        self._pico_executor = ThreadPoolExecutor(max_workers=1)  # Serializes blocking serial commands
+        self._pico_futures = set()                            # Executor jobs not finished yet
+        self._profile_cache_key: Optional[tuple] = None       # GUI state the cached Profile was built from
+        self._profile_cache: Optional[Profile] = None         # Last Profile built by _build_profile_object()
+        self._last_export_key: Optional[tuple] = None         # GUI state of the last Pico export
+        self._last_export_blob: Optional[bytearray] = None    # Event stream sent by the last Pico export
         self._pico_run_thread: Optional[threading.Thread] = None  # Execution thread
         self._pico_is_running = False                         # Execution state
         self._pico_is_paused = False                          # Pause state
+        self._pico_cancel = threading.Event()                 # Set to make the run thread stop waiting
         self._is_closing = False                              # Flag to prevent after() callbacks on destroyed window
+        self._refresh_suppressed = False                      # Set inside _batched_refresh() to defer refreshes
         self._after_ids = []                                  # Track all after() callback IDs for cleanup
+        self._rebuild_after_id: Optional[str] = None          # Pending debounced preview rebuild
         
         # ----------------------------
         # Build GUI and Initialize
         # ----------------------------
-        self._build_layout()         # Create all GUI widgets
-        self._init_positions()       # Initialize position configuration widgets
-        self._init_auxiliary_outputs()  # Initialize auxiliary outputs with defaults
-        
-        # Create a default block with starter example
-        self._add_block("Main Test", cycles=1)
-        self._switch_to_block(0)
-        
-        # Add starter events to the first block
-        self._add_schedule_row("Isolator On", 0, 300)
-        self._add_schedule_row("DUT On Time", 80, 200)
-        self._add_schedule_row("DUT Off Time", 280, 120)
-        self._add_schedule_row("Cycle Delay", 400, 200)
+        # Refreshes are suppressed while populating: the first preview imports
+        # matplotlib, so it is deferred until the window is up
+        self._refresh_suppressed = True
+        try:
+            self._build_layout()         # Create all GUI widgets
+            self._init_positions()       # Initialize position configuration widgets
+            self._init_auxiliary_outputs()  # Initialize auxiliary outputs with defaults
+            
+            # Create a default block with starter example
+            self._add_block("Main Test", cycles=1)
+            self._switch_to_block(0)
+            
+            # Add starter events to the first block
+            self._add_schedule_row("Isolator On", 0, 300)
+            self._add_schedule_row("DUT On Time", 80, 200)
+            self._add_schedule_row("DUT Off Time", 280, 120)
+            self._add_schedule_row("Cycle Delay", 400, 200)
+        finally:
+            self._refresh_suppressed = False
         
-        # Generate initial preview
-        self._rebuild_and_preview()
+        # Generate initial preview once the window is up
+        self._update_event_lists()
+        self._after_ids.append(self.after_idle(self._rebuild_and_preview_now))
 
     def _suppress_callback_errors(self, exc_type, exc_value, exc_traceback):
         """
@@ -486,7 +583,7 @@ class ProfileBuilderApp(tb.Window):
         btns = tb.Frame(sched_box)
         btns.pack(fill=X, pady=(10, 0))
         tb.Button(btns, text="+ Add block", command=self._add_schedule_row).pack(side=LEFT)
-        tb.Button(btns, text="Rebuild", command=self._rebuild_and_preview).pack(side=LEFT, padx=(10, 0))
+        tb.Button(btns, text="Rebuild", command=self._rebuild_and_preview_now).pack(side=LEFT, padx=(10, 0))
 
         # ===========================
         # Cross-Position Settings
@@ -557,14 +654,11 @@ class ProfileBuilderApp(tb.Window):
         self.summary_lbl = tb.Label(preview_box, text="", justify=LEFT)
         self.summary_lbl.pack(anchor=W, pady=(0, 8))
 
-        # matplotlib figure for waveform visualization
-        self.fig = Figure(figsize=(7, 6), dpi=100)
-        self.ax = self.fig.add_subplot(111)
-        self.ax.grid(True)
-
-        # Embed matplotlib canvas in Tkinter
-        self.canvas = FigureCanvasTkAgg(self.fig, master=preview_box)
-        self.canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+        # matplotlib figure and canvas are created on the first preview
+        self._preview_box = preview_box
+        self.fig = None
+        self.ax = None
+        self.canvas = None
 
         # Initialize button states based on connection status
         self._update_pico_button_states()
@@ -630,7 +724,8 @@ class ProfileBuilderApp(tb.Window):
         e.bind("<FocusOut>", lambda _e: self._rebuild_and_preview())
         e.bind("<Return>", lambda _e: self._rebuild_and_preview())
 
-    def _add_schedule_row(self, default_event: str = None, start: float = 0.0, duration: float = 0.0):
+    def _add_schedule_row(self, default_event: str = None, start: float = 0.0, duration: float = 0.0,
+                          available_events: Optional[List[str]] = None):
         """
         Add a new waveform event row to the schedule builder.
         
@@ -646,20 +741,71 @@ class ProfileBuilderApp(tb.Window):
             default_event (str, optional): Initial event type. Defaults to first event in EVENTS list
             start (float, optional): Initial start time. Defaults to 0.0
             duration (float, optional): Initial duration. Defaults to 0.0
+            available_events (List[str], optional): Precomputed dropdown choices,
+                passed when adding many rows at once. Defaults to the current
+                base + auxiliary events
         
         The row is stored in self.schedule_rows for later access and deletion.
         """
         # Get available events (base + auxiliary)
-        available_events = self._get_available_events()
+        if available_events is None:
+            available_events = self._get_available_events()
         
         # Create Tkinter variables for this row
         ev_var = tk.StringVar(value=default_event or available_events[0] if available_events else EVENTS[0])
         st_var = tk.DoubleVar(value=float(start))
         du_var = tk.DoubleVar(value=float(duration))
 
+        # Show the row (reusing a pooled row widget if possible)
+        self._attach_schedule_row(ev_var, st_var, du_var, available_events)
+
+    def _attach_schedule_row(self, ev_var: tk.StringVar, st_var: tk.DoubleVar, du_var: tk.DoubleVar,
+                             available_events: List[str]):
+        """
+        Show a schedule row bound to the given variables at the end of the editor.
+        
+        A hidden row from the widget pool is rebound to the variables when one
+        is available; new widgets are only created when the pool is empty.
+        Loading a 10-row profile after another 10-row profile (or switching
+        between blocks) therefore creates no widgets.
+        
+        Args:
+            ev_var (tk.StringVar): Event type variable
+            st_var (tk.DoubleVar): Start time variable
+            du_var (tk.DoubleVar): Duration variable
+            available_events (List[str]): Choices for the event dropdown
+        """
+        if self._schedule_row_pool:
+            row = self._schedule_row_pool.pop()
+            # Children are created in order: combobox, start, duration, remove button
+            cb, st, du = row.winfo_children()[:3]
+            cb.configure(textvariable=ev_var, values=available_events)
+            st.configure(textvariable=st_var)
+            du.configure(textvariable=du_var)
+        else:
+            row = self._create_schedule_row_widgets(ev_var, st_var, du_var, available_events)
+        
+        row.pack(fill=X, pady=2)
+        
+        # Store row data for later access
+        self.schedule_rows.append((ev_var, st_var, du_var, row))
+
+    def _create_schedule_row_widgets(self, ev_var: tk.StringVar, st_var: tk.DoubleVar, du_var: tk.DoubleVar,
+                                     available_events: List[str]) -> tb.Frame:
+        """
+        Create the widgets of one schedule row (the frame is not packed).
+        
+        Args:
+            ev_var (tk.StringVar): Event type variable
+            st_var (tk.DoubleVar): Start time variable
+            du_var (tk.DoubleVar): Duration variable
+            available_events (List[str]): Choices for the event dropdown
+        
+        Returns:
+            tb.Frame: The row frame containing all row widgets
+        """
         # Create the row frame
         row = tb.Frame(self.sched_container)
-        row.pack(fill=X, pady=2)
 
         # Event type dropdown
         cb = tb.Combobox(row, textvariable=ev_var, values=available_events, state="readonly", width=22)
@@ -680,31 +826,69 @@ class ProfileBuilderApp(tb.Window):
                 if frame is row:
                     self.schedule_rows.pop(i)
                     break
-            row.destroy()
+            self._release_schedule_row(row)
             self._rebuild_and_preview()
 
         # Remove button
         tb.Button(row, text="Remove", bootstyle=SECONDARY, command=remove).pack(side=LEFT, padx=(10, 0))
 
-        # Bind change events to trigger waveform rebuild
-        cb.bind("<<ComboboxSelected>>", lambda _e: self._rebuild_and_preview())
-        st.bind("<FocusOut>", lambda _e: self._rebuild_and_preview())
-        du.bind("<FocusOut>", lambda _e: self._rebuild_and_preview())
-        st.bind("<Return>", lambda _e: self._rebuild_and_preview())
-        du.bind("<Return>", lambda _e: self._rebuild_and_preview())
+        # Change events trigger a waveform rebuild through the shared bind tags
+        # (inserted after the widget's own tag, before its class bindings)
+        for widget, tag in ((cb, self._SCHEDULE_COMBO_TAG), (st, self._SCHEDULE_ENTRY_TAG), (du, self._SCHEDULE_ENTRY_TAG)):
+            tags = widget.bindtags()
+            widget.bindtags(tags[:1] + (tag,) + tags[1:])
 
-        # Store row data for later access
-        self.schedule_rows.append((ev_var, st_var, du_var, row))
+        return row
+
+    def _release_schedule_row(self, row: tb.Frame):
+        """
+        Hide a schedule row frame and keep it in the pool for reuse.
+        
+        Args:
+            row (tb.Frame): Row frame that is no longer in ``schedule_rows``
+        """
+        row.pack_forget()
+        self._schedule_row_pool.append(row)
+
+    def _diff_schedule_rows(self, events: List[ScheduledEvent]):
+        """
+        Make the schedule editor show the given events, reusing row widgets.
+        
+        Existing rows have their variables updated in place; only surplus
+        rows are released to the widget pool and only missing rows are
+        added, so loading a 20-event block over an 18-row editor adds just
+        two rows.
+        
+        Args:
+            events (List[ScheduledEvent]): Events the editor should contain
+        """
+        # Release surplus rows to the pool
+        while len(self.schedule_rows) > len(events):
+            _ev_var, _st_var, _du_var, frame = self.schedule_rows.pop()
+            self._release_schedule_row(frame)
+        
+        # Update existing rows in place, then add the missing ones
+        # (the dropdown choices are computed once for all of them)
+        available_events = self._get_available_events()
+        for i, ev in enumerate(events):
+            if i < len(self.schedule_rows):
+                ev_var, st_var, du_var, _frame = self.schedule_rows[i]
+                ev_var.set(ev.event)
+                st_var.set(ev.start)
+                du_var.set(ev.duration)
+            else:
+                self._add_schedule_row(ev.event, ev.start, ev.duration, available_events)
 
     def _clear_schedule_rows(self):
         """
         Remove all schedule rows from the GUI.
         
-        Used when loading a profile from file to clear existing schedule
-        before populating with loaded data.
+        Used when switching blocks, before the target block's rows are
+        shown in the editor. The row frames are hidden and pooled rather
+        than destroyed, so the next rows shown reuse their widgets.
         """
         for _ev_var, _st_var, _du_var, frame in self.schedule_rows:
-            frame.destroy()
+            self._release_schedule_row(frame)
         self.schedule_rows.clear()
 
     def _init_positions(self):
@@ -824,9 +1008,7 @@ class ProfileBuilderApp(tb.Window):
         from config import DEFAULT_AUXILIARY_OUTPUTS
         
         # Clear any existing auxiliary widgets
-        for _name_var, _gpio_var, _enabled_var, _always_on_var, frame in self.auxiliary_outputs:
-            frame.destroy()
-        self.auxiliary_outputs.clear()
+        self._clear_auxiliary_outputs_bulk()
         
         # Add default auxiliary outputs
         for name, gpio in DEFAULT_AUXILIARY_OUTPUTS:
@@ -895,6 +1077,19 @@ class ProfileBuilderApp(tb.Window):
         # Update available events
         self._on_auxiliary_changed()
 
+    def _clear_auxiliary_outputs_bulk(self):
+        """
+        Remove all auxiliary output rows at once.
+        
+        Unlike calling _remove_last_auxiliary_output() in a loop, event lists
+        and the preview are refreshed once (or not at all when called inside
+        another _batched_refresh()), not once per removed row.
+        """
+        with self._batched_refresh():
+            for _name_var, _gpio_var, _enabled_var, _always_on_var, frame in self.auxiliary_outputs:
+                frame.destroy()
+            self.auxiliary_outputs = []
+
     def _remove_last_auxiliary_output(self):
         """
         Remove the last auxiliary output from the configuration.
@@ -938,8 +1133,8 @@ class ProfileBuilderApp(tb.Window):
         1. Updates available events in all schedule comboboxes
         2. Rebuilds waveform preview
         """
-        # Return immediately if window is closing
-        if getattr(self, '_is_closing', False):
+        # Return immediately if window is closing or refreshes are batched
+        if getattr(self, '_is_closing', False) or self._refresh_suppressed:
             return
             
         # Update event lists in all schedule rows
@@ -955,24 +1150,12 @@ class ProfileBuilderApp(tb.Window):
         Dynamically generates event list based on enabled auxiliary outputs.
         Each enabled output adds two events: "{Name} On" and "{Name} Off"
         """
-        # Get base events
-        events = list(EVENTS)
-        
-        # Add auxiliary events (only for outputs that are not always_on)
-        for name_var, _gpio_var, enabled_var, always_on_var, _frame in self.auxiliary_outputs:
-            if enabled_var.get() and not always_on_var.get():
-                name = name_var.get().strip()
-                if name:
-                    events.append(f"{name} On")
-                    events.append(f"{name} Off")
+        # Base events + auxiliary events (computed once for all rows)
+        events = self._get_available_events()
         
-        # Update all schedule row comboboxes
-        for ev_var, _st_var, _du_var, frame in self.schedule_rows:
-            # Find the combobox widget in this row
-            for widget in frame.winfo_children():
-                if isinstance(widget, tb.Combobox):
-                    widget.configure(values=events)
-                    break
+        # Update all schedule row comboboxes (the first child of each row frame)
+        for _ev_var, _st_var, _du_var, frame in self.schedule_rows:
+            frame.winfo_children()[0].configure(values=events)
 
     def _get_available_events(self) -> List[str]:
         """
@@ -998,17 +1181,21 @@ class ProfileBuilderApp(tb.Window):
     # Block Management Methods
     # ===========================
 
-    def _add_block(self, name: str = None, cycles: int = 1):
+    def _add_block(self, name: str = None, cycles: int = 1,
+                   initial_schedule: Optional[List[ScheduledEvent]] = None):
         """
         Add a new block to the test sequence.
         
         Args:
             name (str, optional): Block name. Defaults to "Block N"
             cycles (int, optional): Number of cycles for this block. Defaults to 1
+            initial_schedule (List[ScheduledEvent], optional): Events the block
+                starts with. Only their variables are created; row widgets are
+                built when the block is shown in the editor. Defaults to empty
         
         Creates:
             - Block name and cycles variables
-            - Empty schedule rows list for this block
+            - Schedule rows list for this block (empty unless initial_schedule is given)
             - Block selector button in the block list
         """
         # Auto-generate name if not provided
@@ -1018,7 +1205,7 @@ class ProfileBuilderApp(tb.Window):
         # Create variables for this block
         block_name_var = tk.StringVar(value=name)
         block_cycles_var = tk.IntVar(value=cycles)
-        block_schedule_rows = []  # Will hold schedule rows for this block
+        block_schedule_rows = self._make_schedule_vars(initial_schedule or [])  # Schedule rows for this block
         
         # Create block selector frame
         block_frame = tb.Frame(self.block_list_container)
@@ -1027,14 +1214,11 @@ class ProfileBuilderApp(tb.Window):
         block_idx = len(self.blocks)
         
         # Block selection button (shows block name and cycles)
-        def make_select_cmd(idx):
-            return lambda: self._switch_to_block(idx)
-        
         btn = tb.Button(
             block_frame, 
             text=f"{name} ({cycles} cycles)",
             bootstyle=INFO,
-            command=make_select_cmd(block_idx),
+            command=partial(self._switch_to_block, block_idx),
             width=20
         )
         btn.pack(side=LEFT, padx=(0, 5))
@@ -1059,6 +1243,22 @@ class ProfileBuilderApp(tb.Window):
         # Update UI
         self._update_block_button()
 
+    def _make_schedule_vars(self, events: List[ScheduledEvent]) -> List[Tuple[tk.StringVar, tk.DoubleVar, tk.DoubleVar]]:
+        """
+        Create schedule row variables for a block that is not in the editor.
+        
+        Args:
+            events (List[ScheduledEvent]): Events to create variables for
+        
+        Returns:
+            List[Tuple]: ``(event, start, duration)`` variable tuples in the
+                         format stored in ``self.blocks``
+        """
+        return [
+            (tk.StringVar(value=ev.event), tk.DoubleVar(value=float(ev.start)), tk.DoubleVar(value=float(ev.duration)))
+            for ev in events
+        ]
+
     def _switch_to_block(self, block_idx: int):
         """
         Switch the schedule editor to display a different block.
@@ -1083,49 +1283,19 @@ class ProfileBuilderApp(tb.Window):
                 current_rows.append((ev_var, st_var, du_var))
         
         # Clear the schedule editor
-        for _ev_var, _st_var, _du_var, frame in self.schedule_rows:
-            frame.destroy()
-        self.schedule_rows.clear()
+        self._clear_schedule_rows()
         
         # Load target block's schedule rows
         block_name_var, block_cycles_var, block_rows, block_frame = self.blocks[block_idx]
         self.current_block_index = block_idx
         
-        # Recreate schedule rows for this block
+        # Show this block's schedule rows (reusing pooled row widgets)
+        available_events = self._get_available_events()
         for ev_var, st_var, du_var in block_rows:
-            # Recreate the row widget
-            row = tb.Frame(self.sched_container)
-            row.pack(fill=X, pady=2)
-            
-            cb = tb.Combobox(row, textvariable=ev_var, values=EVENTS, state="readonly", width=22)
-            cb.pack(side=LEFT)
-            
-            st = tb.Entry(row, textvariable=st_var, width=10)
-            st.pack(side=LEFT, padx=(6, 0))
-            
-            du = tb.Entry(row, textvariable=du_var, width=10)
-            du.pack(side=LEFT, padx=(6, 0))
-            
-            def remove(r=row):
-                for i, (_a, _b, _c, frame) in enumerate(self.schedule_rows):
-                    if frame is r:
-                        self.schedule_rows.pop(i)
-                        break
-                r.destroy()
-                self._rebuild_and_preview()
-            
-            tb.Button(row, text="Remove", bootstyle=SECONDARY, command=remove).pack(side=LEFT, padx=(10, 0))
-            
-            cb.bind("<<ComboboxSelected>>", lambda _e: self._rebuild_and_preview())
-            st.bind("<FocusOut>", lambda _e: self._rebuild_and_preview())
-            du.bind("<FocusOut>", lambda _e: self._rebuild_and_preview())
-            st.bind("<Return>", lambda _e: self._rebuild_and_preview())
-            du.bind("<Return>", lambda _e: self._rebuild_and_preview())
-            
-            self.schedule_rows.append((ev_var, st_var, du_var, row))
+            self._attach_schedule_row(ev_var, st_var, du_var, available_events)
         
         # Update current block indicator
-        self.current_block_label.config(text=f"Block: {block_name_var.get()} ({block_cycles_var.get()} cycles)")
+        self._update_current_block_label()
         
         # Rebuild preview
         self._rebuild_and_preview()
@@ -1134,17 +1304,32 @@ class ProfileBuilderApp(tb.Window):
         """
         Update current block label and trigger preview rebuild when name or cycles changes.
         """
-        # Return immediately if window is closing
-        if getattr(self, '_is_closing', False):
+        # Return immediately if window is closing or refreshes are batched
+        if getattr(self, '_is_closing', False) or self._refresh_suppressed:
             return
             
         # Update current block label if needed
+        self._update_current_block_label()
+        
+        # Trigger preview rebuild
+        self._rebuild_and_preview()
+
+    def _update_current_block_label(self):
+        """Show the current block's name and cycle count in the top bar."""
         if 0 <= self.current_block_index < len(self.blocks):
             name_var, cycles_var, _, _ = self.blocks[self.current_block_index]
             self.current_block_label.config(text=f"Block: {name_var.get()} ({cycles_var.get()} cycles)")
+
+    def _refresh_block_button(self, block_idx: int):
+        """
+        Update a block selector button's text after its name or cycles changed in place.
         
-        # Trigger preview rebuild
-        self._rebuild_and_preview()
+        Args:
+            block_idx (int): Index of the block whose button should be refreshed
+        """
+        name_var, cycles_var, _, block_frame = self.blocks[block_idx]
+        # The selector button is the first widget packed into the block frame
+        block_frame.winfo_children()[0].configure(text=f"{name_var.get()} ({cycles_var.get()} cycles)")
 
     def _on_add_block(self):
         """Handle Add Block button click."""
@@ -1164,6 +1349,9 @@ class ProfileBuilderApp(tb.Window):
         block_frame.destroy()
         self.blocks.pop(self.current_block_index)
         
+        # Point the remaining selector buttons at their new indices
+        self._rebuild_block_list()
+        
         # Switch to previous block or first block
         new_idx = max(0, self.current_block_index - 1)
         self.current_block_index = -1  # Force reload
@@ -1202,42 +1390,24 @@ class ProfileBuilderApp(tb.Window):
         self._switch_to_block(idx + 1)
 
     def _rebuild_block_list(self):
-        """Rebuild the block list UI after reordering."""
-        # Clear container
-        for widget in self.block_list_container.winfo_children():
-            widget.destroy()
-        
-        # Recreate all block frames
-        for idx, (name_var, cycles_var, rows, old_frame) in enumerate(self.blocks):
-            block_frame = tb.Frame(self.block_list_container)
+        """
+        Re-pack the block list in ``self.blocks`` order after reordering or removal.
+        
+        The existing block frames are reused: each is unpacked and packed
+        again in list order, and its selector button is pointed at the
+        block's new index (its text is refreshed too, as edits to the name
+        and cycles entries do not update it). No widgets are destroyed or created.
+        """
+        for _, _, _, block_frame in self.blocks:
+            block_frame.pack_forget()
+        
+        for idx, (name_var, cycles_var, _rows, block_frame) in enumerate(self.blocks):
             block_frame.pack(fill=X, pady=2)
-            
-            def make_select_cmd(i):
-                return lambda: self._switch_to_block(i)
-            
-            btn = tb.Button(
-                block_frame, 
+            # The selector button is the first widget packed into the block frame
+            block_frame.winfo_children()[0].configure(
                 text=f"{name_var.get()} ({cycles_var.get()} cycles)",
-                bootstyle=INFO,
-                command=make_select_cmd(idx),
-                width=20
+                command=partial(self._switch_to_block, idx),
             )
-            btn.pack(side=LEFT, padx=(0, 5))
-            
-            tb.Label(block_frame, text="Name:", width=6).pack(side=LEFT)
-            name_entry = tb.Entry(block_frame, textvariable=name_var, width=15)
-            name_entry.pack(side=LEFT, padx=(0, 5))
-            name_entry.bind("<FocusOut>", lambda _e: self._update_block_button())
-            name_entry.bind("<Return>", lambda _e: self._update_block_button())
-            
-            tb.Label(block_frame, text="Cycles:", width=7).pack(side=LEFT)
-            cycles_entry = tb.Entry(block_frame, textvariable=cycles_var, width=6)
-            cycles_entry.pack(side=LEFT)
-            cycles_entry.bind("<FocusOut>", lambda _e: self._update_block_button())
-            cycles_entry.bind("<Return>", lambda _e: self._update_block_button())
-            
-            # Update tuple with new frame
-            self.blocks[idx] = (name_var, cycles_var, rows, block_frame)
 
     def _get_blocks(self) -> List[Block]:
         """
@@ -1272,19 +1442,39 @@ class ProfileBuilderApp(tb.Window):
 
 
     def _rebuild_and_preview(self):
+        """
+        Schedule a preview rebuild, coalescing bursts of changes.
+        
+        Called whenever any setting changes. Each call restarts a short
+        REBUILD_DEBOUNCE_MS timer, so tabbing through a row of entries (one
+        FocusOut each) rebuilds once, after the last change, instead of once
+        per entry.
+        """
+        if getattr(self, '_is_closing', False):
+            return
+        
+        if self._rebuild_after_id is not None:
+            self.after_cancel(self._rebuild_after_id)
+        self._rebuild_after_id = self.after(REBUILD_DEBOUNCE_MS, self._rebuild_and_preview_now)
+
+    def _rebuild_and_preview_now(self):
         """
         Rebuild waveforms and update the preview display.
         
         This is the central method that orchestrates waveform generation and
-        visualization. It's called automatically whenever any setting changes.
+        visualization. Setting changes reach it through the debounced
+        _rebuild_and_preview(); the Rebuild button calls it directly.
         
         Process Flow:
-        1. Clear the matplotlib axes
-        2. Read current settings (units, blocks, positions)
-        3. Call waveform_engine to generate waveforms from all blocks
-        4. Generate multi-channel preview data
-        5. Update summary text
-        6. Plot waveforms on matplotlib canvas with block boundaries
+        1. Read current settings (units, blocks, positions)
+        2. Call waveform_engine to generate waveforms from all blocks
+        3. Generate multi-channel preview data
+        4. Update summary text
+        5. Plot waveforms on matplotlib canvas with block boundaries
+           (each channel's trace is reused and updated with set_data; axes
+           are only reconfigured when the set of channels changes, and when
+           the axis limits are unchanged the traces are blitted over the
+           cached background instead of redrawing the figure)
         
         Plot Style:
             - If ramps exist: Use line plot (shows smooth transitions)
@@ -1302,13 +1492,18 @@ class ProfileBuilderApp(tb.Window):
             This method is called frequently, so it must be fast.
             All heavy computation is done in the waveform_engine module.
         """
+        self._rebuild_after_id = None
+        
         # Return immediately if window is closing (prevents bgerror from event handlers)
         if getattr(self, '_is_closing', False):
             return
-            
-        # Clear the previous plot
-        self.ax.clear()
-        self.ax.grid(True)
+        
+        # Skip inside _batched_refresh() (rebuilt once when the batch ends)
+        if self._refresh_suppressed:
+            return
+
+        # First preview: import matplotlib and create the canvas
+        self._init_preview_canvas()
 
         # Get current settings from GUI
         unit = self.waveform_unit.get()
@@ -1322,17 +1517,24 @@ class ProfileBuilderApp(tb.Window):
         else:
             blocks = all_blocks
 
-        # Generate waveforms using waveform_engine
+        # Generate waveforms using waveform_engine, unless the blocks, unit and
+        # auxiliary outputs are unchanged (e.g. only positions or row delay were edited).
+        # The model dataclasses compare by value, so the key needs no hashing.
+        wave_key = (unit, blocks, auxiliary_outputs)
         try:
-            (self.iso_digital, self.dut_digital,
-             self.iso_display, self.dut_display,
-             self.iso_has_ramps, self.dut_has_ramps,
-             self.total_length_ms, self.block_end_times, self.auxiliary_waveforms) = build_waveforms_from_blocks(
-                blocks, unit, auxiliary_outputs=auxiliary_outputs
-            )
+            if wave_key != self._wave_key:
+                self._wave_key = None
+                (self.iso_digital, self.dut_digital,
+                 self.iso_display, self.dut_display,
+                 self.iso_has_ramps, self.dut_has_ramps,
+                 self.total_length_ms, self.block_end_times, self.auxiliary_waveforms) = build_waveforms_from_blocks(
+                    blocks, unit, auxiliary_outputs=auxiliary_outputs
+                )
+                self._wave_key = wave_key
         except Exception as e:
             # Display error and abort preview
             self.summary_lbl.config(text=f"Waveform error: {e}")
+            self._clear_preview_axes()
             self.ax.text(0.5, 0.5, str(e), ha="center", va="center", transform=self.ax.transAxes)
             self.canvas.draw()
             return
@@ -1367,12 +1569,19 @@ class ProfileBuilderApp(tb.Window):
 
         # Check if there are channels to plot
         if not channels:
+            self._clear_preview_axes()
             self.ax.text(0.5, 0.5, "No positions enabled.", ha="center", va="center", transform=self.ax.transAxes)
             self.canvas.draw()
             return
 
+        # Only reconfigure the axes when the channel set changes; otherwise
+        # keep ticks, labels and layout and just update each trace's data
+        labels = tuple(channels.keys())
+        layout_changed = labels != self._last_channel_labels
+        if layout_changed:
+            self._clear_preview_axes()
+
         # Plot each channel with vertical offset
-        labels = list(channels.keys())
         for yi, label in enumerate(labels):
             payload = channels[label]
             
@@ -1385,26 +1594,112 @@ class ProfileBuilderApp(tb.Window):
                 # Use line plot for smooth ramp visualization
                 t = payload["display_t"]
                 v = payload["display_v"]
-                self.ax.plot(t, [val + yi * 2 for val in v])
+                drawstyle = "default"
             else:
                 # Use step plot for digital edges
                 t = payload["digital_t"]
                 v = payload["digital_v"]
-                self.ax.step(t, [val + yi * 2 for val in v], where="post")
+                drawstyle = "steps-post"
+
+            line = self._channel_lines.get(label)
+            if line is None:
+                line = self._channel_lines[label] = self.ax.plot([], [], animated=True)[0]
+            line.set_drawstyle(drawstyle)
+            line.set_data(t, v + yi * 2.0)
 
         # Draw vertical lines at block boundaries
-        for block_end_time in self.block_end_times[:-1]:  # Skip the last one (end of profile)
-            self.ax.axvline(x=block_end_time, color='red', linestyle='--', alpha=0.5, linewidth=1)
+        for line in self._boundary_lines:
+            line.remove()
+        self._boundary_lines = [
+            self.ax.axvline(x=block_end_time, color='red', linestyle='--', alpha=0.5, linewidth=1, animated=True)
+            for block_end_time in self.block_end_times[:-1]  # Skip the last one (end of profile)
+        ]
+
+        # set_data() does not update the data limits, so recompute them
+        self.ax.relim()
+        self.ax.autoscale_view()
+
+        if layout_changed:
+            # Configure axes and apply tight layout (expensive, so only on channel changes)
+            self.ax.set_yticks([yi * 2 + 0.5 for yi in range(len(labels))])
+            self.ax.set_yticklabels(labels, fontsize=8)
+            self.ax.set_xlabel("Time (ms)")
+            self.ax.set_title("Preview (red lines = block boundaries)")
+            self.fig.tight_layout()
+            self._last_channel_labels = labels
+        
+        # Same axes and limits as the cached background: only repaint the traces
+        limits = (self.ax.get_xlim(), self.ax.get_ylim())
+        if not layout_changed and limits == self._preview_limits and self._preview_bg is not None:
+            self.canvas.restore_region(self._preview_bg)
+            self._draw_preview_traces()
+            self.canvas.blit(self.fig.bbox)
+            return
+        
+        # Otherwise schedule a full redraw on the next idle cycle
+        # (_on_preview_draw caches the new background)
+        self._preview_limits = limits
+        self.canvas.draw_idle()
+
+    def _draw_preview_traces(self):
+        """Draw the animated preview artists (channel traces and block boundaries)."""
+        for line in self._channel_lines.values():
+            self.ax.draw_artist(line)
+        for line in self._boundary_lines:
+            self.ax.draw_artist(line)
 
-        # Configure axes
-        self.ax.set_yticks([yi * 2 + 0.5 for yi in range(len(labels))])
-        self.ax.set_yticklabels(labels, fontsize=8)
-        self.ax.set_xlabel("Time (ms)")
-        self.ax.set_title("Preview (red lines = block boundaries)")
+    def _on_preview_draw(self, _event):
+        """
+        matplotlib draw_event handler: cache the background and add the traces.
         
-        # Apply tight layout and redraw
-        self.fig.tight_layout()
-        self.canvas.draw()
+        The traces are animated artists, so a full draw renders everything
+        else; that render is saved for blitting, and the traces are drawn on
+        top of it before it is shown.
+        """
+        self._preview_bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_preview_traces()
+
+    def _init_preview_canvas(self):
+        """
+        Create the matplotlib figure and embed it in the preview panel.
+        
+        matplotlib is imported here rather than at module level because it
+        adds several hundred milliseconds to start-up. Called at the start
+        of every preview rebuild; does nothing once the canvas exists.
+        """
+        if self.canvas is not None:
+            return
+
+        import matplotlib
+        matplotlib.use("TkAgg")  # Use TkAgg backend for embedding in Tkinter
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from matplotlib.figure import Figure
+
+        # matplotlib figure for waveform visualization
+        self.fig = Figure(figsize=(7, 6), dpi=100)
+        self.ax = self.fig.add_subplot(111)
+        self.ax.grid(True)
+
+        # Embed matplotlib canvas in Tkinter
+        self.canvas = FigureCanvasTkAgg(self.fig, master=self._preview_box)
+        self.canvas.get_tk_widget().pack(fill=BOTH, expand=YES)
+
+        # Every full draw (including resizes) refreshes the blitting background
+        self.canvas.mpl_connect("draw_event", self._on_preview_draw)
+
+    def _clear_preview_axes(self):
+        """
+        Fully reset the preview axes.
+        
+        Forgets the configured channel labels and preview traces so the next
+        successful preview recreates them and reconfigures ticks, title and
+        layout from scratch.
+        """
+        self.ax.clear()
+        self.ax.grid(True)
+        self._last_channel_labels = ()
+        self._channel_lines = {}
+        self._boundary_lines = []
 
     def _build_profile_object(self) -> Profile:
         """
@@ -1433,6 +1728,26 @@ class ProfileBuilderApp(tb.Window):
             - Saving to file
             - Uploading to Pico
             - Sharing with others
+        
+        The last built Profile is cached against _export_state_key(), so
+        e.g. saving right after an export does not rebuild the waveforms.
+        Callers must treat the returned Profile as read-only.
+        """
+        state_key = self._export_state_key()
+        if state_key == self._profile_cache_key:
+            return self._profile_cache
+        
+        prof = self._build_profile_uncached()
+        self._profile_cache_key = state_key
+        self._profile_cache = prof
+        return prof
+
+    def _build_profile_uncached(self) -> Profile:
+        """
+        Build a Profile from the current GUI settings (see _build_profile_object).
+        
+        Raises:
+            ValueError: If validation fails or waveform generation fails
         """
         # Get current position configurations
         positions = self._get_positions()
@@ -1470,15 +1785,65 @@ class ProfileBuilderApp(tb.Window):
             auxiliary_waveforms=aux_waveforms,
         )
 
-    def _profile_to_json_text(self, prof: Profile) -> str:
+    def _export_state_key(self) -> tuple:
         """
-        Convert a Profile object to JSON text.
+        Snapshot every GUI value that affects the built profile.
+        
+        Returns:
+            tuple: Hashable tuple of raw Tk variable values (profile settings,
+                   blocks with their rows, positions and auxiliary outputs)
+        
+        Two equal keys produce the same Profile, so the key can be compared
+        against a cached one to skip rebuilding and re-serializing. Only Tk
+        variables are read, which is far cheaper than building waveforms.
+        
+        Raises:
+            tk.TclError: If a numeric field holds text that is not a number
+        """
+        blocks = []
+        for idx, (name_var, cycles_var, rows, _frame) in enumerate(self.blocks):
+            # The current block's live rows are in the editor, not in the block tuple
+            if idx == self.current_block_index:
+                rows = [(ev_var, st_var, du_var) for ev_var, st_var, du_var, _ in self.schedule_rows]
+            blocks.append((
+                name_var.get(),
+                cycles_var.get(),
+                tuple((ev_var.get(), st_var.get(), du_var.get()) for ev_var, st_var, du_var in rows),
+            ))
+
+        positions = tuple(
+            (
+                self.pos_enabled_vars[i].get(),
+                self.pos_iso_gpio_vars[i].get(),
+                self.pos_dut_gpio_vars[i].get(),
+                self.pos_offset_vars[i].get(),
+            )
+            for i in range(self.num_positions)
+        )
+        auxiliary = tuple(
+            (name_var.get(), gpio_var.get(), enabled_var.get(), always_on_var.get())
+            for name_var, gpio_var, enabled_var, always_on_var, _frame in self.auxiliary_outputs
+        )
+
+        return (
+            self.profile_name.get(),
+            self.waveform_unit.get(),
+            self.row_delay_ms.get(),
+            tuple(blocks),
+            positions,
+            auxiliary,
+        )
+
+    def _profile_to_json_bytes(self, prof: Profile) -> bytes:
+        """
+        Convert a Profile object to UTF-8 encoded JSON.
         
         Args:
             prof (Profile): Profile object to serialize
         
         Returns:
-            str: Pretty-printed JSON string
+            bytes: Pretty-printed (2-space indented) JSON, encoded with orjson
+                   when it is installed, otherwise with the stdlib json module
         
         The JSON format is human-readable and includes:
             - All profile settings
@@ -1490,16 +1855,12 @@ class ProfileBuilderApp(tb.Window):
             - File save/load operations
             - Pico firmware (which expects this exact structure)
         """
-        # Convert Profile to dictionary using dataclasses.asdict
-        data = asdict(prof)
-        
-        # Explicitly convert nested dataclasses to dicts
-        data["positions"] = [asdict(p) for p in prof.positions]
-        data["blocks"] = [asdict(b) for b in prof.blocks]
-        data["auxiliary_outputs"] = [asdict(aux) for aux in prof.auxiliary_outputs] if prof.auxiliary_outputs else []
-        
-        # Return pretty-printed JSON
-        return json.dumps(data, indent=2)
+        # to_dict() builds the structure without deep-copying the waveform
+        # point lists, unlike dataclasses.asdict
+        data = prof.to_dict()
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2).encode("utf-8")
 
     def _on_save_profile(self):
         """
@@ -1544,9 +1905,9 @@ class ProfileBuilderApp(tb.Window):
 
         # Write profile to file
         try:
-            json_text = self._profile_to_json_text(prof)
-            with open(save_path, "w", encoding="utf-8") as f:
-                f.write(json_text)
+            json_bytes = self._profile_to_json_bytes(prof)
+            with open(save_path, "wb") as f:
+                f.write(json_bytes)
         except Exception as e:
             messagebox.showerror("Save Error", str(e))
             return
@@ -1561,7 +1922,7 @@ class ProfileBuilderApp(tb.Window):
         This method:
         1. Opens a file open dialog
         2. Reads and parses JSON file
-        3. Validates JSON structure
+        3. Decodes and validates JSON structure (Profile.from_dict)
         4. Populates GUI with loaded settings
         5. Rebuilds waveform preview
         
@@ -1597,145 +1958,133 @@ class ProfileBuilderApp(tb.Window):
 
         # Read and parse JSON file
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json_file(path)
         except Exception as e:
             messagebox.showerror("Load Error", f"Could not read JSON:\n{e}")
             return
 
-        # Populate GUI with loaded data
+        # Populate GUI with loaded data. The document is decoded into typed model
+        # objects first, so structural errors surface before any widget is touched.
         try:
-            # Load basic settings
-            self.profile_name.set(data.get("profile_name", "Profile"))
-            self.waveform_unit.set(data.get("waveform_time_units", "ms"))
-            self.row_delay_ms.set(float(data.get("row_delay_ms", 0.0)))
-
-            # Check if this is new format (with blocks) or old format (single schedule + cycles)
-            if "blocks" in data:
-                # New format: load all blocks
-                blocks_data = data.get("blocks", [])
-                if not isinstance(blocks_data, list):
-                    raise ValueError("blocks must be a list")
-                
-                if not blocks_data:
-                    raise ValueError("blocks list cannot be empty")
-                
-                # Clear existing blocks (keep at least one empty block)
-                while len(self.blocks) > 1:
-                    _, _, _, block_frame = self.blocks[-1]
-                    block_frame.destroy()
-                    self.blocks.pop()
-                
-                # Load each block
-                for i, block_data in enumerate(blocks_data):
-                    block_name = block_data.get("block_name", f"Block {i+1}")
-                    block_cycles = int(block_data.get("cycles", 1))
-                    block_schedule = block_data.get("scheduled_events", [])
-                    
-                    if not isinstance(block_schedule, list):
-                        raise ValueError(f"scheduled_events in block '{block_name}' must be a list")
-                    
-                    # Use existing first block or add new block
-                    if i == 0:
-                        # Update first block
-                        name_var, cycles_var, _, _ = self.blocks[0]
-                        name_var.set(block_name)
-                        cycles_var.set(block_cycles)
-                        self.current_block_index = -1  # Force reload
-                        self._switch_to_block(0)
-                    else:
-                        # Add new block
-                        self._add_block(block_name, block_cycles)
-                    
-                    # Switch to this block and load its schedule
-                    self._switch_to_block(i)
-                    self._clear_schedule_rows()
-                    
-                    for ev in block_schedule:
-                        event = ev.get("event", EVENTS[0])
-                        start = float(ev.get("start", 0.0))
-                        duration = float(ev.get("duration", 0.0))
-                        
-                        # Note: Event type not validated here to allow auxiliary events
-                        
-                        self._add_schedule_row(event, start, duration)
-                
-                # Switch back to first block
-                self._switch_to_block(0)
-                
-            else:
-                # Old format: single schedule + cycles (backward compatibility)
-                sched = data.get("scheduled_events", [])
-                if not isinstance(sched, list):
-                    raise ValueError("scheduled_events must be a list")
-                
-                cycles = int(data.get("cycles", 1))
-                
-                # Clear existing blocks and create single block
-                while len(self.blocks) > 1:
-                    _, _, _, block_frame = self.blocks[-1]
-                    block_frame.destroy()
-                    self.blocks.pop()
-                
-                # Update first block
-                name_var, cycles_var, _, _ = self.blocks[0]
-                name_var.set("Main Block")
-                cycles_var.set(cycles)
-                self.current_block_index = -1
-                self._switch_to_block(0)
-                
-                # Load schedule into first block
-                self._clear_schedule_rows()
-                for ev in sched:
-                    event = ev.get("event", EVENTS[0])
-                    start = float(ev.get("start", 0.0))
-                    duration = float(ev.get("duration", 0.0))
-                    
-                    # Note: Event type not validated here to allow auxiliary events
-                    
-                    self._add_schedule_row(event, start, duration)
-
-            # Load position configurations
-            pos_list = data.get("positions", [])
-            if not isinstance(pos_list, list):
-                raise ValueError("positions must be a list")
-
-            # Reinitialize positions if count changed
-            if len(pos_list) > 0:
-                self.num_positions = len(pos_list)
-                self.default_isolator_gpios = list(range(1, self.num_positions + 1))
-                self.default_dut_gpios = list(range(21, 21 + self.num_positions))
-                self._init_positions()
-
-                # Populate position settings
-                for i, p in enumerate(pos_list):
-                    if i >= self.num_positions:
-                        break
-                    
-                    self.pos_enabled_vars[i].set(bool(p.get("enabled", False)))
-                    self.pos_iso_gpio_vars[i].set(int(p.get("isolator_gpio", i + 1)))
-                    self.pos_dut_gpio_vars[i].set(int(p.get("dut_gpio", 21 + i)))
-                    self.pos_offset_vars[i].set(float(p.get("dut_offset_ms", 0.0)))
-
-            # Load auxiliary outputs (with backward compatibility)
-            aux_list = data.get("auxiliary_outputs", [])
-            if aux_list and isinstance(aux_list, list):
-                # Clear existing auxiliary outputs
-                while self.auxiliary_outputs:
-                    self._remove_last_auxiliary_output()
-                
-                # Load each auxiliary output
-                for aux in aux_list:
-                    name = aux.get("name", "Aux")
-                    gpio = int(aux.get("gpio", 15))
-                    enabled = bool(aux.get("enabled", True))
-                    self._add_auxiliary_output(name=name, gpio=gpio, enabled=enabled)
-
+            prof = Profile.from_dict(data)
+            # Event lists and preview are refreshed once when the batch ends
+            with self._batched_refresh():
+                self._apply_loaded_profile(prof)
         except Exception as e:
             messagebox.showerror("Load Error", f"Profile format error:\n{e}")
             return
 
-        # Rebuild preview with loaded data
+    def _apply_loaded_profile(self, prof: Profile):
+        """
+        Populate the GUI from a decoded profile.
+        
+        The block/schedule containers are unpacked while widgets are created,
+        so Tk lays them out once at the end instead of once per block and row.
+        Call inside _batched_refresh() so the preview is rebuilt only once.
+        
+        Args:
+            prof (Profile): Profile decoded by Profile.from_dict()
+        """
+        self.block_list_container.pack_forget()
+        self.sched_container.pack_forget()
+        try:
+            # Load basic settings
+            self.profile_name.set(prof.profile_name)
+            self.waveform_unit.set(prof.waveform_time_units)
+            self.row_delay_ms.set(prof.row_delay_ms)
+
+            # Destroy only the surplus blocks (old single-schedule files decode to one block)
+            while len(self.blocks) > len(prof.blocks):
+                _, _, _, block_frame = self.blocks.pop()
+                block_frame.destroy()
+            
+            # Load each block: existing blocks are updated in place, missing ones are
+            # added. Blocks after the first only hold row variables; the first block
+            # is shown in the editor below, so its stored rows are left empty
+            for i, block in enumerate(prof.blocks):
+                initial_schedule = block.scheduled_events if i > 0 else None
+                if i < len(self.blocks):
+                    name_var, cycles_var, rows, _ = self.blocks[i]
+                    name_var.set(block.block_name)
+                    cycles_var.set(block.cycles)
+                    rows[:] = self._make_schedule_vars(initial_schedule or [])
+                    self._refresh_block_button(i)
+                else:
+                    self._add_block(block.block_name, block.cycles, initial_schedule=initial_schedule)
+            
+            # Show the first block, reusing whatever rows the editor already has
+            # (their previous block was overwritten above, so nothing is saved)
+            self.current_block_index = 0
+            # Note: Event type not validated here to allow auxiliary events
+            self._diff_schedule_rows(prof.blocks[0].scheduled_events)
+            self._update_current_block_label()
+
+            # Load positions if the file defines them (rows are only rebuilt
+            # when the position count changes)
+            if prof.positions:
+                if self.num_positions != len(prof.positions):
+                    self.num_positions = len(prof.positions)
+                    self.default_isolator_gpios = tuple(range(1, self.num_positions + 1))
+                    self.default_dut_gpios = tuple(range(21, 21 + self.num_positions))
+                    self._init_positions()
+
+                # Populate position settings straight into the Tcl variables
+                # (skips the per-type Variable.set wrappers)
+                setvar = self.setvar
+                for i, p in enumerate(prof.positions):
+                    setvar(str(self.pos_enabled_vars[i]), bool(p.enabled))
+                    setvar(str(self.pos_iso_gpio_vars[i]), int(p.isolator_gpio))
+                    setvar(str(self.pos_dut_gpio_vars[i]), int(p.dut_gpio))
+                    setvar(str(self.pos_offset_vars[i]), float(p.dut_offset_ms))
+
+            # Load auxiliary outputs (files without them keep the current outputs)
+            if prof.auxiliary_outputs:
+                if len(self.auxiliary_outputs) == len(prof.auxiliary_outputs):
+                    # Same count: update the existing rows in place
+                    for (name_var, gpio_var, enabled_var, always_on_var, _frame), aux in zip(
+                        self.auxiliary_outputs, prof.auxiliary_outputs
+                    ):
+                        name_var.set(aux.name)
+                        gpio_var.set(aux.gpio)
+                        enabled_var.set(aux.enabled)
+                        always_on_var.set(aux.always_on)
+                else:
+                    # Replace all rows
+                    self._clear_auxiliary_outputs_bulk()
+                    for aux in prof.auxiliary_outputs:
+                        self._add_auxiliary_output(
+                            name=aux.name, gpio=aux.gpio, enabled=aux.enabled, always_on=aux.always_on
+                        )
+        finally:
+            self.block_list_container.pack(fill=BOTH, expand=YES)
+            self.sched_container.pack(fill=BOTH, expand=YES)
+
+    @contextmanager
+    def _batched_refresh(self):
+        """
+        Defer event-list and preview refreshes until the block exits.
+        
+        Every refresh entry point (_rebuild_and_preview, _on_auxiliary_changed,
+        _update_block_button) returns early while the batch is active; on a
+        normal exit the event lists and preview are refreshed exactly once.
+        Nested batches are folded into the outermost one.
+        
+        Example:
+            >>> with self._batched_refresh():
+            ...     self._add_block("Init", 1)
+            ...     self._add_auxiliary_output("Relay", 17)
+        """
+        if self._refresh_suppressed:
+            yield
+            return
+        
+        self._refresh_suppressed = True
+        try:
+            yield
+        finally:
+            self._refresh_suppressed = False
+        
+        self._update_event_lists()
         self._rebuild_and_preview()
 
     # ===========================
@@ -1754,14 +2103,61 @@ class ProfileBuilderApp(tb.Window):
         """
         self.pico_status.set(f"Pico: {text}")
 
+    def _pico_call_async(self, fn, *args, on_result):
+        """
+        Run a blocking PicoLink call on the background executor.
+        
+        Serial round-trips can take up to the port timeout, so they never
+        run on the Tk main thread. The outcome is posted to ``_pico_q`` as
+        ``("result", on_result, value)`` and ``on_result(value)`` is called
+        on the GUI thread by ``_drain_pico_queue``.
+        
+        Args:
+            fn: PicoLink method (or any callable) to run
+            *args: Positional arguments passed to ``fn``
+            on_result: Callback receiving the return value, or the raised
+                exception if the call failed
+        
+        Example:
+            >>> self._pico_call_async(self.pico.ping, on_result=self._on_ping_result)
+        """
+        def task():
+            try:
+                value = fn(*args)
+            except Exception as e:
+                value = e
+            self._post_pico_msg(("result", on_result, value))
+
+        future = self._pico_executor.submit(task)
+        self._pico_futures.add(future)
+        future.add_done_callback(self._pico_futures.discard)
+
+    def _post_pico_msg(self, item: tuple):
+        """
+        Queue a message for the GUI thread and wake it up.
+        
+        Called from background threads. The ``<<PicoMsg>>`` virtual event
+        is appended to the Tk event queue, so ``_drain_pico_queue`` runs on
+        the next event-loop pass instead of the GUI polling on a timer.
+        
+        Args:
+            item (tuple): ``(kind, target, payload)`` message for ``_drain_pico_queue``
+        """
+        self._pico_q.put(item)
+        try:
+            self.event_generate("<<PicoMsg>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # Window already destroyed, nothing left to notify
+            pass
+
     def _pico_connect(self):
         """
         Handle Connect button click.
         
         Establishes serial connection to the Pico:
         1. Reads COM port and baud rate from GUI
-        2. Calls PicoLink.connect()
-        3. Updates status and button states
+        2. Calls PicoLink.connect() on the background executor
+        3. Updates status and button states when the result arrives
         
         Error Handling:
             - Shows error dialog if connection fails
@@ -1771,20 +2167,32 @@ class ProfileBuilderApp(tb.Window):
         try:
             port = self.pico_port.get().strip()
             baud = int(self.pico_baud.get())
-            self.pico.connect(port, baud=baud, timeout=1.0)
-            self._pico_set_status(f"Connected on {port} @ {baud}")
         except Exception as e:
             self._pico_set_status("Disconnected")
             messagebox.showerror("Pico Connect Error", str(e))
-        finally:
-            self._update_pico_button_states()
+            return
+
+        self._pico_set_status(f"Connecting to {port}...")
+        self._pico_call_async(
+            self.pico.connect, port, baud, 1.0,
+            on_result=partial(self._on_connect_result, port, baud),
+        )
+
+    def _on_connect_result(self, port: str, baud: int, result):
+        """Apply the outcome of ``_pico_connect`` on the GUI thread."""
+        if isinstance(result, Exception):
+            self._pico_set_status("Disconnected")
+            messagebox.showerror("Pico Connect Error", str(result))
+        else:
+            self._pico_set_status(f"Connected on {port} @ {baud}")
+        self._update_pico_button_states()
 
     def _pico_ping(self):
         """
         Handle Ping button click.
         
         Tests if the Pico is responsive:
-        1. Sends PING command
+        1. Sends PING command (on the background executor)
         2. Waits for PONG response
         3. Updates status based on response
         
@@ -1793,17 +2201,18 @@ class ProfileBuilderApp(tb.Window):
             - Pico firmware is running
             - Command protocol is functional
         """
-        try:
-            resp = self.pico.ping()
-            if resp == "PONG":
-                self._pico_set_status(f"Connected (PONG) on {self.pico.port}")
-            else:
-                self._pico_set_status(f"Ping failed: {resp}")
-                messagebox.showerror("Pico Ping Error", resp or "No response from Pico.")
-        except Exception as e:
-            messagebox.showerror("Pico Ping Error", str(e))
-        finally:
-            self._update_pico_button_states()
+        self._pico_call_async(self.pico.ping, on_result=self._on_ping_result)
+
+    def _on_ping_result(self, resp):
+        """Apply the outcome of ``_pico_ping`` on the GUI thread."""
+        if isinstance(resp, Exception):
+            messagebox.showerror("Pico Ping Error", str(resp))
+        elif resp == "PONG":
+            self._pico_set_status(f"Connected (PONG) on {self.pico.port}")
+        else:
+            self._pico_set_status(f"Ping failed: {resp}")
+            messagebox.showerror("Pico Ping Error", resp or "No response from Pico.")
+        self._update_pico_button_states()
 
     def _pico_export_current(self):
         """
@@ -1811,12 +2220,13 @@ class ProfileBuilderApp(tb.Window):
         
         Uploads the current profile to Pico:
         1. Builds profile from current GUI state
-        2. Converts to JSON text
-        3. Sends PUT command with profile data
+        2. Expands it into the packed GPIO event stream (see event_stream.py)
+        3. Streams the PUT_BIN command and data (on the background executor)
         4. Updates status based on response
         
-        The profile is stored on the Pico's filesystem and can be
-        executed later with the Run command.
+        The event stream is stored on the Pico's filesystem and can be
+        executed later with the Run command. All per-position shifting,
+        sorting and grouping happens here, so the Pico only dispatches.
         
         Error Handling:
             - Validates profile before upload
@@ -1824,34 +2234,49 @@ class ProfileBuilderApp(tb.Window):
             - Shows error if upload fails
         """
         try:
-            # Build and validate profile
-            prof = self._build_profile_object()
-            json_text = self._profile_to_json_text(prof)
-
-            # Upload to Pico
-            filename = self.pico_filename.get().strip() or "profile.json"
-            resp = self.pico.put_json(filename, json_text)
-
-            # Update status based on response
-            if resp.startswith("OK"):
-                self._pico_set_status(f"Exported to {filename} (OK)")
+            # Reuse the last export's event stream when nothing changed since then
+            state_key = self._export_state_key()
+            if state_key == self._last_export_key:
+                blob = self._last_export_blob
             else:
-                self._pico_set_status(f"Export failed: {resp}")
-                messagebox.showerror("Pico Export Error", resp or "No response from Pico.")
+                # Build and validate profile (reads Tk variables, so stays on the GUI thread)
+                prof = self._build_profile_object()
+                blob = pack_event_stream(*build_event_stream(prof))
+                self._last_export_key = state_key
+                self._last_export_blob = blob
         except Exception as e:
             messagebox.showerror("Pico Export Error", str(e))
-        finally:
-            self._update_pico_button_states()
+            return
+
+        # Upload to Pico
+        filename = self.pico_filename.get().strip() or "profile.bin"
+        self._pico_set_status(f"Exporting {filename}...")
+        self._pico_call_async(
+            self.pico.put_bin, filename, blob,
+            on_result=partial(self._on_export_result, filename),
+        )
+
+    def _on_export_result(self, filename: str, resp):
+        """Apply the outcome of ``_pico_export_current`` on the GUI thread."""
+        if isinstance(resp, Exception):
+            messagebox.showerror("Pico Export Error", str(resp))
+        elif resp.startswith("OK"):
+            self._pico_set_status(f"Exported to {filename} (OK)")
+        else:
+            self._pico_set_status(f"Export failed: {resp}")
+            messagebox.showerror("Pico Export Error", resp or "No response from Pico.")
+        self._update_pico_button_states()
 
     def _pico_run(self):
         """
         Handle Run on Pico button click.
         
         Starts profile execution on the Pico in a background thread:
-        1. Validates no execution is already running
-        2. Sends RUN command to Pico
-        3. Starts background thread to wait for completion
-        4. Updates button states to show running
+        1. Validates no execution is already running or queued
+        2. Marks the run as started, which disables the Run button
+        3. Sends RUN command to Pico (on the background executor)
+        4. Starts background thread to wait for completion
+           (or resets the running state if RUN failed)
         
         Background Thread:
             - Calls pico.wait_done() to block until completion
@@ -1869,65 +2294,100 @@ class ProfileBuilderApp(tb.Window):
             - Shows error if RUN command fails
             - Cleans up state on error
         """
-        # Check if already running
-        if self._pico_run_thread and self._pico_run_thread.is_alive():
+        # Check if already running (or a RUN is already queued)
+        if self._pico_is_running or (self._pico_run_thread and self._pico_run_thread.is_alive()):
             messagebox.showinfo("Pico", "Pico is already running a profile.")
             return
 
-        try:
-            # Send RUN command
-            filename = self.pico_filename.get().strip() or "profile.json"
-            resp = self.pico.run(filename)
-            
-            # Check for error response
-            if not resp.startswith("OK"):
-                self._pico_set_status(f"Run failed: {resp}")
-                messagebox.showerror("Pico Run Error", resp or "No response from Pico.")
-                return
-
-            # Update state
-            self._pico_is_running = True
-            self._pico_is_paused = False
-            self._update_pico_button_states()
-            self._pico_set_status(f"Running {filename}...")
+        # Mark the run as started before submitting, so a second click cannot
+        # queue another RUN; _on_run_result resets it if the RUN fails
+        self._pico_is_running = True
+        self._pico_is_paused = False
+        self._update_pico_button_states()
 
-            # Start background thread to wait for completion
-            def worker():
-                """Background thread worker function."""
-                done = self.pico.wait_done(timeout_s=300.0)
-                self._pico_q.put(("done", filename, done))
+        # Send RUN command
+        filename = self.pico_filename.get().strip() or "profile.bin"
+        self._pico_call_async(
+            self.pico.run, filename,
+            on_result=partial(self._on_run_result, filename),
+        )
 
-            self._pico_run_thread = threading.Thread(target=worker, daemon=True)
-            self._pico_run_thread.start()
-            
-            # Start polling the queue for completion
-            after_id = self.after(50, self._poll_pico_queue)
-            self._after_ids.append(after_id)
+    def _on_run_result(self, filename: str, resp):
+        """Start waiting for completion once the Pico acknowledged RUN."""
+        if isinstance(resp, Exception):
+            messagebox.showerror("Pico Run Error", str(resp))
+            self._pico_is_running = False
+            self._pico_is_paused = False
+            self._update_pico_button_states()
+            return
 
-        except Exception as e:
-            messagebox.showerror("Pico Run Error", str(e))
+        # Check for error response
+        if not resp.startswith("OK"):
             self._pico_is_running = False
             self._pico_is_paused = False
             self._update_pico_button_states()
+            self._pico_set_status(f"Run failed: {resp}")
+            messagebox.showerror("Pico Run Error", resp or "No response from Pico.")
+            return
 
-    def _poll_pico_queue(self):
-        """
-        Poll the queue for background thread messages.
-        
-        This method is called periodically by the GUI event loop to check
-        for completion messages from the background execution thread.
-        
-        When a message arrives:
-            - Updates running/paused state
-            - Updates button states
-            - Shows status or error message
-        
-        If the background thread is still running, schedules another
-        poll after 50ms.
+        # Update state
+        self._pico_is_running = True
+        self._pico_is_paused = False
+        self._update_pico_button_states()
+        self._pico_set_status(f"Running {filename}...")
+
+        # Start background thread to wait for completion
+        self._pico_cancel.clear()
+
+        def worker():
+            """Background thread worker function (polls so Stop can cancel it)."""
+            t0 = time.monotonic()
+            last_second = 0
+            try:
+                while not self._pico_cancel.is_set():
+                    elapsed = time.monotonic() - t0
+                    if elapsed > 300.0:
+                        status = "ERR timeout waiting for DONE"
+                        break
+                    status = self.pico.poll_status(timeout_s=0.2)
+                    if status.startswith(("DONE", "ERR")):
+                        break
+                    # Report progress once per elapsed second
+                    if int(elapsed) != last_second:
+                        last_second = int(elapsed)
+                        self._post_pico_msg(("progress", filename, last_second))
+                else:
+                    self._post_pico_msg(("cancelled", filename, ""))
+                    return
+            except Exception as e:
+                status = f"ERR {e}"
+            self._post_pico_msg(("done", filename, status))
+
+        self._pico_run_thread = threading.Thread(target=worker, daemon=True)
+        self._pico_run_thread.start()
+
+    def _drain_pico_queue(self, event=None):
+        """
+        Handle queued background thread messages.
+        
+        Bound to the ``<<PicoMsg>>`` virtual event, which background threads
+        generate after queueing a message, so this runs only when there is
+        something to handle (no periodic polling).
+        
+        Message kinds:
+            - ("result", callback, value): A ``_pico_call_async`` call
+              finished; ``callback(value)`` is invoked here
+            - ("progress", filename, seconds): Execution still running;
+              shows the elapsed time in the status label
+            - ("done", filename, msg): Profile execution completed; updates
+              running/paused state, button states and shows the result
+            - ("cancelled", filename, ""): Stop made the run thread give up
+              waiting; the Stop handler reports the outcome
         
-        This polling mechanism keeps the GUI responsive while allowing
-        background tasks to communicate results safely.
+        Args:
+            event: Tkinter event object (unused)
         """
+
         # Return immediately if window is closing
         if self._is_closing:
             return
@@ -1935,9 +2395,21 @@ class ProfileBuilderApp(tb.Window):
         try:
             # Check for messages (non-blocking)
             while True:
-                kind, filename, msg = self._pico_q.get_nowait()
+                kind, target, msg = self._pico_q.get_nowait()
                 
-                if kind == "done":
+                if kind == "result":
+                    # Executor call finished
+                    target(msg)
+                elif kind == "progress":
+                    # Still running
+                    if self._pico_is_running and not self._pico_is_paused:
+                        self._pico_set_status(f"Running {target}... {msg}s")
+                elif kind == "cancelled":
+                    # Stopped by the user
+                    self._pico_is_running = False
+                    self._pico_is_paused = False
+                    self._update_pico_button_states()
+                elif kind == "done":
                     # Execution completed
                     self._pico_is_running = False
                     self._pico_is_paused = False
@@ -1945,31 +2417,22 @@ class ProfileBuilderApp(tb.Window):
 
                     # Show result
                     if msg.startswith("DONE"):
-                        self._pico_set_status(f"Done: {filename}")
+                        self._pico_set_status(f"Done: {target}")
                     else:
                         self._pico_set_status(f"Run error: {msg}")
                         messagebox.showerror("Pico Run Error", msg)
         except queue.Empty:
             pass  # No messages yet
         except (tk.TclError, RuntimeError):
-            # Window is being destroyed, stop polling
+            # Window is being destroyed
             return
 
-        # Continue polling if thread is still alive and window is not closing
-        if not self._is_closing and self._pico_run_thread and self._pico_run_thread.is_alive():
-            try:
-                after_id = self.after(50, self._poll_pico_queue)
-                self._after_ids.append(after_id)
-            except (tk.TclError, RuntimeError):
-                # Window already destroyed, ignore
-                pass
-
     def _pico_pause(self):
         """
         Handle Pause button click.
         
         Pauses profile execution on the Pico:
-        1. Sends PAUSE command
+        1. Sends PAUSE command (on the background executor)
         2. Updates pause state if successful
         3. Updates button states
         
@@ -1978,47 +2441,49 @@ class ProfileBuilderApp(tb.Window):
             - Timing is frozen
             - Resume button becomes enabled
         """
-        try:
-            resp = self.pico.pause()
-            if resp.startswith("OK"):
-                self._pico_is_paused = True
-                self._pico_set_status("Paused (OK)")
-            else:
-                self._pico_set_status(f"Pause: {resp}")
-        except Exception as e:
-            messagebox.showerror("Pico Pause Error", str(e))
-        finally:
-            self._update_pico_button_states()
+        self._pico_call_async(self.pico.pause, on_result=self._on_pause_result)
+
+    def _on_pause_result(self, resp):
+        """Apply the outcome of ``_pico_pause`` on the GUI thread."""
+        if isinstance(resp, Exception):
+            messagebox.showerror("Pico Pause Error", str(resp))
+        elif resp.startswith("OK"):
+            self._pico_is_paused = True
+            self._pico_set_status("Paused (OK)")
+        else:
+            self._pico_set_status(f"Pause: {resp}")
+        self._update_pico_button_states()
 
     def _pico_resume(self):
         """
         Handle Resume button click.
         
         Resumes paused profile execution on the Pico:
-        1. Sends RESUME command
+        1. Sends RESUME command (on the background executor)
         2. Updates pause state if successful
         3. Updates button states
         
         Execution continues from the exact point where it was paused.
         """
-        try:
-            resp = self.pico.resume()
-            if resp.startswith("OK"):
-                self._pico_is_paused = False
-                self._pico_set_status("Resumed (OK)")
-            else:
-                self._pico_set_status(f"Resume: {resp}")
-        except Exception as e:
-            messagebox.showerror("Pico Resume Error", str(e))
-        finally:
-            self._update_pico_button_states()
+        self._pico_call_async(self.pico.resume, on_result=self._on_resume_result)
+
+    def _on_resume_result(self, resp):
+        """Apply the outcome of ``_pico_resume`` on the GUI thread."""
+        if isinstance(resp, Exception):
+            messagebox.showerror("Pico Resume Error", str(resp))
+        elif resp.startswith("OK"):
+            self._pico_is_paused = False
+            self._pico_set_status("Resumed (OK)")
+        else:
+            self._pico_set_status(f"Resume: {resp}")
+        self._update_pico_button_states()
 
     def _pico_stop(self):
         """
         Handle Stop button click.
         
         Stops profile execution on the Pico immediately:
-        1. Sends STOP command
+        1. Sends STOP command (on the background executor)
         2. Updates running/paused state if successful
         3. Updates button states
         
@@ -2026,27 +2491,30 @@ class ProfileBuilderApp(tb.Window):
             - All GPIO outputs go to their default state
             - Execution cannot be resumed
             - Run button becomes enabled for new execution
+        
+        The run thread is told to stop waiting right away, so it exits
+        within one poll interval (~0.2 s).
         """
-        try:
-            resp = self.pico.stop()
-            if resp.startswith("OK"):
-                self._pico_set_status("Stopped (OK)")
-                self._pico_is_running = False
-                self._pico_is_paused = False
-            else:
-                self._pico_set_status(f"Stop: {resp}")
-        except Exception as e:
-            messagebox.showerror("Pico Stop Error", str(e))
-        finally:
-            self._update_pico_button_states()
+        self._pico_cancel.set()
+        self._pico_call_async(self.pico.stop, on_result=self._on_stop_result)
+
+    def _on_stop_result(self, resp):
+        """Apply the outcome of ``_pico_stop`` on the GUI thread."""
+        if isinstance(resp, Exception):
+            messagebox.showerror("Pico Stop Error", str(resp))
+        elif resp.startswith("OK"):
+            self._pico_set_status("Stopped (OK)")
+            self._pico_is_running = False
+            self._pico_is_paused = False
+        else:
+            self._pico_set_status(f"Stop: {resp}")
+        self._update_pico_button_states()
 
 
     def _on_closing(self):
         """
         Handle window close event - saves theme preference and exits cleanly.
         """
-        import os
-        
         # Set closing flag to prevent any pending after() callbacks
         self._is_closing = True
         
@@ -2057,6 +2525,12 @@ class ProfileBuilderApp(tb.Window):
             except:
                 pass
         self._after_ids.clear()
+        if self._rebuild_after_id is not None:
+            try:
+                self.after_cancel(self._rebuild_after_id)
+            except:
+                pass
+            self._rebuild_after_id = None
         
         # Withdraw window immediately to prevent any further user interaction or events
         try:
@@ -2064,7 +2538,16 @@ class ProfileBuilderApp(tb.Window):
         except:
             pass
         
-        # Stop any running background processes
+        # Stop any running background processes. Queued jobs are cancelled
+        # by hand (shutdown's cancel_futures needs Python 3.9); a failure here
+        # must not keep destroy() below from running
+        try:
+            for future in list(self._pico_futures):
+                future.cancel()
+            self._pico_executor.shutdown(wait=False)
+        except Exception:
+            pass
+        self._pico_cancel.set()
         if self._pico_is_running:
             self._pico_is_running = False
             self._pico_is_paused = False
@@ -2087,11 +2570,12 @@ class ProfileBuilderApp(tb.Window):
         except:
             pass
         
-        # Save theme preference
+        # Save theme preference if it changed, off the UI thread so the window
+        # closes immediately (non-daemon: the interpreter waits for the write)
         try:
-            theme_file = os.path.join(os.path.dirname(__file__), ".theme_preference")
-            with open(theme_file, "w") as f:
-                f.write(self.style.theme.name)
+            theme_name = self.style.theme.name
+            if theme_name != self._saved_theme:
+                threading.Thread(target=self._write_theme, args=(theme_name,), daemon=False).start()
         except:
             pass
         
@@ -2101,6 +2585,21 @@ class ProfileBuilderApp(tb.Window):
         except:
             pass
 
+    @staticmethod
+    def _write_theme(theme_name: str):
+        """
+        Write the theme preference file.
+        
+        Args:
+            theme_name (str): ttkbootstrap theme name to restore on next start
+        """
+        try:
+            theme_file = os.path.join(os.path.dirname(__file__), ".theme_preference")
+            with open(theme_file, "w") as f:
+                f.write(theme_name)
+        except OSError:
+            pass
+
 
 # ================================
 # Application Entry Point
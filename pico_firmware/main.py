@@ -1,16 +1,24 @@
 # Pico main.py (MicroPython)
-# Supports: PING, PUT, RUN, STOP, PAUSE, RESUME
+# Supports: PING, PUT, PUT_BIN, RUN, STOP, PAUSE, RESUME
 
+import os
 import sys
 import json
 import time
+import struct
 import machine
+from array import array
 
 try:
     import uselect
 except ImportError:
     uselect = None
 
+try:
+    import micropython
+except ImportError:
+    micropython = None
+
 def _writeln(s):
     try:
         sys.stdout.write(s + "\n")
@@ -29,23 +37,31 @@ def _readline_blocking():
     except Exception:
         return ""
 
-def _read_exact_str(n):
-    buf = ""
-    while len(buf) < n:
-        chunk = sys.stdin.read(n - len(buf))
+def _read_to_file(f, n, stream):
+    # Copy exactly n bytes from the serial stream into an open file
+    remaining = n
+    while remaining:
+        chunk = stream.read(min(512, remaining))
         if not chunk:
             time.sleep_ms(1)
             continue
-        buf += chunk
-    return buf
+        f.write(chunk)
+        remaining -= len(chunk)
+
+# One poller for stdin, registered once instead of on every poll
+_STDIN_POLL = None
+if uselect is not None:
+    try:
+        _STDIN_POLL = uselect.poll()
+        _STDIN_POLL.register(sys.stdin, uselect.POLLIN)
+    except Exception:
+        _STDIN_POLL = None
 
 def _poll_line_nonblocking():
-    if uselect is None:
+    if _STDIN_POLL is None:
         return ""
     try:
-        p = uselect.poll()
-        p.register(sys.stdin, uselect.POLLIN)
-        if not p.poll(0):
+        if not _STDIN_POLL.poll(0):
             return ""
         return sys.stdin.readline()
     except Exception:
@@ -54,6 +70,38 @@ def _poll_line_nonblocking():
 _stop = False
 _paused = False
 
+# Longest sleep between command polls while waiting for the next event
+_CMD_POLL_MS = 10
+
+# Top-level keys a profile must have to be run
+_REQUIRED_KEYS = frozenset(("positions", "row_delay_ms", "isolator_waveform_points", "dut_waveform_points"))
+
+# Highest GPIO number (GPIO0..GPIO29 fit in one 32-bit mask)
+_MAX_GPIO = 29
+
+# Binary event stream uploaded with PUT_BIN (built by the PC's event_stream.py):
+# magic, u32 event count, u32 mask of used GPIOs, then one
+# (i32 t_ms, u32 set_mask, u32 clr_mask) record per distinct time
+_BIN_MAGIC = b"PBEV"
+_BIN_HEADER_SIZE = 12
+_BIN_RECORD = "<iII"
+_BIN_RECORD_SIZE = 12
+
+# RP2040 SIO GPIO_OUT_SET/GPIO_OUT_CLR: storing a mask drives all its GPIOs
+# HIGH/LOW in one write. These addresses are RP2040-only (the RP2350 on the
+# Pico 2 has other registers there), so every other chip and port falls
+# back to Pin.value() per GPIO.
+_GPIO_OUT_SET = 0xD0000014
+_GPIO_OUT_CLR = 0xD0000018
+
+def _is_rp2040():
+    try:
+        return "RP2040" in os.uname().machine
+    except Exception:
+        return False
+
+_USE_SIO = sys.platform == "rp2" and hasattr(machine, "mem32") and _is_rp2040()
+
 def _set_stop(v):
     global _stop
     _stop = v
@@ -68,6 +116,16 @@ def _set_paused(v):
 def _get_paused():
     return _paused
 
+def _apply_masks(pin_bits, set_mask, clr_mask):
+    for bit, p in pin_bits:
+        try:
+            if set_mask & bit:
+                p.value(1)
+            elif clr_mask & bit:
+                p.value(0)
+        except Exception:
+            pass
+
 def _safe_all_low(pin_map):
     for _g, p in pin_map.items():
         try:
@@ -76,32 +134,64 @@ def _safe_all_low(pin_map):
             pass
 
 def _validate_profile(d):
-    for k in ("positions", "row_delay_ms", "isolator_waveform_points", "dut_waveform_points"):
-        if k not in d:
-            raise ValueError("Missing key: {}".format(k))
+    missing = _REQUIRED_KEYS.difference(d)
+    if missing:
+        raise ValueError("Missing key: {}".format(", ".join(sorted(missing))))
     if not isinstance(d["positions"], list):
         raise ValueError("positions must be a list")
 
+def _point(it):
+    # (t_ms, 0/1) for a [time, state] pair, None for anything else
+    if not isinstance(it, (list, tuple)) or len(it) != 2:
+        return None
+    return (int(round(float(it[0]))), 1 if int(it[1]) else 0)
+
+def _anchor_points(cleaned):
+    if not cleaned:
+        cleaned = [(0, 0)]
+    if cleaned[0][0] > 0:
+        cleaned.insert(0, (0, 0))
+    return cleaned
+
 def _clean_points(points):
-    pts = []
+    # Waveforms from the PC arrive sorted, so round and compact them in one
+    # pass; only points out of (t, state) order fall back to a full sort
+    cleaned = []
+    prev = None
+    last = None
     for it in points:
-        if not isinstance(it, (list, tuple)) or len(it) != 2:
+        p = _point(it)
+        if p is None:
             continue
-        t = int(round(float(it[0])))
-        s = 1 if int(it[1]) else 0
-        pts.append((t, s))
+        if prev is not None and p < prev:
+            return _clean_points_sorted(points)
+        prev = p
+        if p[1] != last:
+            cleaned.append(p)
+            last = p[1]
+    return _anchor_points(cleaned)
+
+def _clean_points_sorted(points):
+    pts = []
+    for it in points:
+        p = _point(it)
+        if p is not None:
+            pts.append(p)
     pts.sort()  # no-arg sort
     cleaned = []
     last = None
     for t, s in pts:
-        if last is None or s != last:
+        if s != last:
             cleaned.append((t, s))
             last = s
-    if not cleaned:
-        cleaned = [(0, 0)]
-    if cleaned[0][0] > 0:
-        cleaned.insert(0, (0, 0))
-    return cleaned
+    return _anchor_points(cleaned)
+
+def _gpio_key(gpio):
+    # GPIO number shifted into place for an event key (see _build_events)
+    g = int(gpio)
+    if g < 0 or g > _MAX_GPIO:
+        raise ValueError("Invalid GPIO: {}".format(g))
+    return g << 1
 
 def _build_events(profile):
     positions = profile["positions"]
@@ -117,19 +207,21 @@ def _build_events(profile):
     if not enabled:
         raise ValueError("No positions enabled")
 
-    events = []  # (t_ms, gpio, state)
+    # Each event is packed into one int, (t_ms << 8) + (gpio << 1) + state,
+    # which sorts exactly like a (t_ms, gpio, state) tuple without allocating one
+    keys = []
     
     # Add position-specific events (isolator and DUT)
     for idx, p in enumerate(enabled):
         base_shift = idx * row_delay_ms
         dut_offset = int(round(float(p.get("dut_offset_ms", 0.0))))
-        iso_gpio = int(p["isolator_gpio"])
-        dut_gpio = int(p["dut_gpio"])
+        iso_key = _gpio_key(p["isolator_gpio"])
+        dut_key = _gpio_key(p["dut_gpio"])
 
         for t, s in iso_pts:
-            events.append((t + base_shift, iso_gpio, s))
+            keys.append(((t + base_shift) << 8) + iso_key + s)
         for t, s in dut_pts:
-            events.append((t + base_shift + dut_offset, dut_gpio, s))
+            keys.append(((t + base_shift + dut_offset) << 8) + dut_key + s)
     
     # Add auxiliary output events (not position-specific, run at their scheduled times)
     auxiliary_outputs = profile.get("auxiliary_outputs", [])
@@ -150,36 +242,90 @@ def _build_events(profile):
         # Get the waveform points for this auxiliary output
         aux_waveform = auxiliary_waveforms.get(aux_name, [])
         if aux_waveform:
+            aux_key = _gpio_key(aux_gpio)
             aux_pts = _clean_points(aux_waveform)
             for t, s in aux_pts:
-                events.append((t, int(aux_gpio), s))
+                keys.append((t << 8) + aux_key + s)
+
+    keys.sort()  # no-arg sort
+
+    # Group each time's edges into set/clear masks; keys of one time are
+    # sorted by GPIO then state, so a GPIO's last edge at that time wins
+    times = array("i")
+    sets = array("I")
+    clrs = array("I")
+    used = 0
+    for k in keys:
+        t = k >> 8
+        bit = 1 << ((k >> 1) & 0x7F)
+        if not times or times[-1] != t:
+            times.append(t)
+            sets.append(0)
+            clrs.append(0)
+        if k & 1:
+            sets[-1] |= bit
+            clrs[-1] &= ~bit
+        else:
+            clrs[-1] |= bit
+            sets[-1] &= ~bit
+        used |= bit
+    return times, sets, clrs, used
+
+def _load_event_stream(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    n, used = struct.unpack_from("<II", data, 4)
+    if len(data) != _BIN_HEADER_SIZE + n * _BIN_RECORD_SIZE:
+        raise ValueError("Bad event stream size")
+
+    times = array("i")
+    sets = array("I")
+    clrs = array("I")
+    off = _BIN_HEADER_SIZE
+    for _ in range(n):
+        t, set_mask, clr_mask = struct.unpack_from(_BIN_RECORD, data, off)
+        times.append(t)
+        sets.append(set_mask)
+        clrs.append(clr_mask)
+        off += _BIN_RECORD_SIZE
+    return times, sets, clrs, used
+
+def _load_events(path):
+    # Event stream from PUT_BIN, or a JSON profile from PUT expanded here
+    with open(path, "rb") as f:
+        is_bin = f.read(4) == _BIN_MAGIC
+    if is_bin:
+        return _load_event_stream(path)
 
-    events.sort()  # no-arg sort
-    return events
+    with open(path, "r") as f:
+        prof = json.load(f)
+    _validate_profile(prof)
+    return _build_events(prof)
 
 def _run_profile_file(path):
     _set_stop(False)
     _set_paused(False)
 
-    with open(path, "r") as f:
-        prof = json.load(f)
-    _validate_profile(prof)
-
-    events = _build_events(prof)
+    times, sets, clrs, used = _load_events(path)
 
     pins = {}
-    for _t, gpio, _s in events:
-        if gpio not in pins:
+    for gpio in range(_MAX_GPIO + 1):
+        if used & (1 << gpio):
             pins[gpio] = machine.Pin(gpio, machine.Pin.OUT)
             pins[gpio].value(0)
 
     _safe_all_low(pins)
 
+    # Pins are configured as outputs above; events then write the SIO
+    # registers directly, or walk (mask bit, Pin) pairs off-RP2040
+    mem32 = machine.mem32 if _USE_SIO else None
+    pin_bits = [(1 << g, p) for g, p in pins.items()]
+
     t0 = time.ticks_ms()
     pause_start = 0
 
     i = 0
-    n = len(events)
+    n = len(times)
 
     while i < n:
         # process incoming commands while running
@@ -212,21 +358,29 @@ def _run_profile_file(path):
             time.sleep_ms(5)
             continue
 
-        t_ms, _gpio, _state = events[i]
-        elapsed = time.ticks_diff(time.ticks_ms(), t0)
+        t_ms = times[i]
+        remaining = t_ms - time.ticks_diff(time.ticks_ms(), t0)
 
-        if elapsed < t_ms:
-            time.sleep_ms(1)
+        if remaining > 1:
+            # Sleep until ~1 ms before the event, waking at least every
+            # _CMD_POLL_MS to handle STOP/PAUSE/RESUME
+            time.sleep_ms(min(remaining - 1, _CMD_POLL_MS))
             continue
-
-        same_t = t_ms
-        while i < n and events[i][0] == same_t:
-            _, g, s = events[i]
-            try:
-                pins[g].value(1 if s else 0)
-            except Exception:
+        if remaining > 0:
+            # Final stretch: spin to the deadline instead of oversleeping
+            while time.ticks_diff(time.ticks_ms(), t0) < t_ms:
                 pass
-            i += 1
+
+        if mem32 is not None:
+            set_mask = sets[i]
+            clr_mask = clrs[i]
+            if set_mask:
+                mem32[_GPIO_OUT_SET] = set_mask
+            if clr_mask:
+                mem32[_GPIO_OUT_CLR] = clr_mask
+        else:
+            _apply_masks(pin_bits, sets[i], clrs[i])
+        i += 1
 
     _safe_all_low(pins)
     return "DONE"
@@ -284,16 +438,56 @@ def main():
                 _writeln("ERR PUT nbytes")
                 continue
 
+            # Stream straight to flash; the profile is parsed and validated on RUN.
+            # nbytes counts UTF-8 bytes, so read the byte stream, not text
             try:
-                raw_str = _read_exact_str(nbytes)
-                obj = json.loads(raw_str)
-                with open(filename, "w") as f:
-                    json.dump(obj, f)
+                with open(filename, "wb") as f:
+                    _read_to_file(f, nbytes, sys.stdin.buffer)
                 _writeln("OK PUT")
             except Exception as e:
                 _writeln("ERR {}".format(e))
             continue
 
+        if cmd.startswith("PUT_BIN "):
+            parts = cmd.split()
+            if len(parts) != 3:
+                _writeln("ERR PUT_BIN format")
+                continue
+
+            filename = parts[1]
+            try:
+                nbytes = int(parts[2])
+            except Exception:
+                _writeln("ERR PUT_BIN nbytes")
+                continue
+
+            try:
+                f = open(filename, "wb")
+            except Exception as e:
+                _writeln("ERR {}".format(e))
+                continue
+
+            # Raw bytes may contain 0x03, which must not raise KeyboardInterrupt.
+            # USB CDC checks for it as bytes arrive, so the PC only sends the
+            # payload after READY, i.e. once Ctrl-C is already disabled
+            if micropython is not None:
+                micropython.kbd_intr(-1)
+            try:
+                _writeln("READY")
+                _read_to_file(f, nbytes, sys.stdin.buffer)
+                f.close()
+                _writeln("OK PUT_BIN")
+            except Exception as e:
+                _writeln("ERR {}".format(e))
+            finally:
+                if micropython is not None:
+                    micropython.kbd_intr(3)
+                try:
+                    f.close()
+                except Exception:
+                    pass
+            continue
+
         if cmd.startswith("RUN "):
             parts = cmd.split(" ", 1)
             if len(parts) != 2:
@@ -0,0 +1,97 @@
+"""Unit tests for event_stream module."""
+
+import pytest
+from pc_app.models import PositionConfig, Profile, AuxiliaryOutput
+from pc_app.event_stream import (
+    build_event_stream, pack_event_stream,
+    EVENT_STREAM_MAGIC, EVENT_STREAM_HEADER, EVENT_STREAM_RECORD,
+)
+
+
+def _profile(positions, iso, dut, row_delay_ms=0.0, aux=None, aux_waveforms=None):
+    """Build a minimal Profile around the given waveforms."""
+    return Profile(
+        profile_name="Test",
+        waveform_time_units="ms",
+        blocks=[],
+        isolator_waveform_points=iso,
+        dut_waveform_points=dut,
+        row_delay_ms=row_delay_ms,
+        positions=positions,
+        auxiliary_outputs=aux,
+        auxiliary_waveforms=aux_waveforms,
+    )
+
+
+class TestBuildEventStream:
+    """Tests for build_event_stream function."""
+
+    def test_single_position(self):
+        """Test edges of one position are grouped into masks by time."""
+        prof = _profile(
+            [PositionConfig(1, True, 2, 3)],
+            iso=[(0.0, 1), (100.0, 0)],
+            dut=[(0.0, 0), (50.0, 1), (100.0, 0)],
+        )
+        events, used = build_event_stream(prof)
+        assert events == [(0, 1 << 2, 1 << 3), (50, 1 << 3, 0), (100, 0, (1 << 2) | (1 << 3))]
+        assert used == (1 << 2) | (1 << 3)
+
+    def test_row_delay_and_dut_offset(self):
+        """Test positions are shifted by row delay, DUTs also by their offset."""
+        prof = _profile(
+            [PositionConfig(1, True, 0, 1, 5.0), PositionConfig(2, True, 2, 3)],
+            iso=[(10.0, 1)],
+            dut=[(20.0, 1)],
+            row_delay_ms=100.0,
+        )
+        events, _ = build_event_stream(prof)
+        set_times = {t: m for t, m, _ in events if m}
+        assert set_times == {10: 1 << 0, 25: 1 << 1, 110: 1 << 2, 120: 1 << 3}
+
+    def test_high_edge_wins_at_same_time(self):
+        """Test a GPIO driven LOW and HIGH at the same ms ends HIGH."""
+        prof = _profile(
+            [PositionConfig(1, True, 4, 4)],
+            iso=[(0.0, 1)],
+            dut=[(0.0, 0)],
+        )
+        events, _ = build_event_stream(prof)
+        assert events == [(0, 1 << 4, 0)]
+
+    def test_disabled_positions_and_aux(self):
+        """Test disabled positions and auxiliary outputs are skipped."""
+        prof = _profile(
+            [PositionConfig(1, False, 0, 1), PositionConfig(2, True, 2, 3)],
+            iso=[], dut=[],
+            aux=[AuxiliaryOutput("PSU", 5), AuxiliaryOutput("Relay", 6, enabled=False)],
+            aux_waveforms={"PSU": [(0.0, 1)], "Relay": [(0.0, 1)]},
+        )
+        events, used = build_event_stream(prof)
+        assert events == [(0, 1 << 5, (1 << 2) | (1 << 3))]
+        assert used == (1 << 2) | (1 << 3) | (1 << 5)
+
+    def test_invalid_gpio(self):
+        """Test GPIOs the RP2040 does not have are rejected."""
+        prof = _profile([PositionConfig(1, True, 30, 1)], iso=[], dut=[])
+        with pytest.raises(ValueError):
+            build_event_stream(prof)
+
+    def test_no_enabled_positions(self):
+        """Test a profile without enabled positions is rejected."""
+        prof = _profile([PositionConfig(1, False, 0, 1)], iso=[], dut=[])
+        with pytest.raises(ValueError):
+            build_event_stream(prof)
+
+
+class TestPackEventStream:
+    """Tests for pack_event_stream function."""
+
+    def test_round_trip(self):
+        """Test the blob holds the header and one record per event."""
+        events = [(-3, 1 << 29, 0), (0, 0, 1 << 29)]
+        blob = pack_event_stream(events, 1 << 29)
+        assert EVENT_STREAM_HEADER.unpack_from(blob) == (EVENT_STREAM_MAGIC, 2, 1 << 29)
+        assert len(blob) == EVENT_STREAM_HEADER.size + 2 * EVENT_STREAM_RECORD.size
+        records = list(EVENT_STREAM_RECORD.iter_unpack(blob[EVENT_STREAM_HEADER.size:]))
+        assert records == events
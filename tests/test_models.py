@@ -1,7 +1,8 @@
 """Unit tests for models module."""
 
 import pytest
-from pc_app.models import ScheduledEvent, Block, PositionConfig, Profile, EVENTS
+from dataclasses import asdict, fields
+from pc_app.models import ScheduledEvent, Block, PositionConfig, Profile, AuxiliaryOutput, EVENTS
 
 
 class TestScheduledEvent:
@@ -97,6 +98,28 @@ class TestProfile:
         assert len(profile.positions) == 1
         assert profile.row_delay_ms == 0.0
     
+    def test_to_dict_matches_asdict(self):
+        """Test that to_dict() builds the same structure as dataclasses.asdict()."""
+        profile = Profile(
+            profile_name="Test Profile",
+            waveform_time_units="ms",
+            blocks=[Block("Block 1", [ScheduledEvent("Isolator On", 0.0, 100.0)], 2)],
+            isolator_waveform_points=[(0.0, 1), (100.0, 0)],
+            dut_waveform_points=[(0.0, 0), (100.0, 0)],
+            row_delay_ms=5.0,
+            positions=[PositionConfig(1, True, 1, 21, 0.0)],
+            auxiliary_outputs=[AuxiliaryOutput("Relay", 17)],
+            auxiliary_waveforms={"Relay": [(0.0, 0), (100.0, 0)]},
+        )
+        
+        assert profile.to_dict() == asdict(profile)
+        assert list(profile.to_dict()) == list(asdict(profile))
+    
+    def test_field_names_match_dataclass_fields(self):
+        """Test that every model's _FIELD_NAMES lists its fields in order."""
+        for cls in (PositionConfig, ScheduledEvent, Block, AuxiliaryOutput, Profile):
+            assert cls._FIELD_NAMES == tuple(f.name for f in fields(cls))
+    
     def test_profile_with_multiple_blocks(self):
         """Test profile with multiple blocks."""
         block1 = Block("Init", [ScheduledEvent("Isolator On", 0, 100)], 1)
@@ -118,3 +141,65 @@ class TestProfile:
         assert len(profile.blocks) == 3
         total_cycles = sum(b.cycles for b in profile.blocks)
         assert total_cycles == 12
+
+
+class TestProfileFromDict:
+    """Tests for decoding profile JSON documents."""
+    
+    def test_from_dict_blocks(self):
+        """Test decoding a block-based profile with defaults applied."""
+        data = {
+            "profile_name": "Loaded",
+            "blocks": [
+                {"block_name": "Init", "cycles": 2,
+                 "scheduled_events": [{"event": "Isolator On", "start": 0, "duration": 100}]},
+                {"scheduled_events": [{"event": "Power Supply 1 On"}]},
+            ],
+            "positions": [{"enabled": True}, {"dut_offset_ms": 5}],
+        }
+        
+        profile = Profile.from_dict(data)
+        
+        assert profile.profile_name == "Loaded"
+        assert profile.waveform_time_units == "ms"
+        assert profile.blocks[0].cycles == 2
+        assert profile.blocks[0].scheduled_events[0] == ScheduledEvent("Isolator On", 0.0, 100.0)
+        assert profile.blocks[1].block_name == "Block 2"
+        assert profile.blocks[1].scheduled_events[0].event == "Power Supply 1 On"
+        assert profile.positions[1] == PositionConfig(2, False, 2, 22, 5.0)
+        assert profile.auxiliary_outputs == []
+    
+    def test_from_dict_old_format(self):
+        """Test that old single-schedule files decode to one block."""
+        data = {"cycles": 3, "scheduled_events": [{"event": "Cycle Delay", "start": 0, "duration": 10}]}
+        
+        profile = Profile.from_dict(data)
+        
+        assert len(profile.blocks) == 1
+        assert profile.blocks[0].block_name == "Main Block"
+        assert profile.blocks[0].cycles == 3
+    
+    def test_from_dict_invalid_structure(self):
+        """Test that structural errors raise ValueError."""
+        with pytest.raises(ValueError, match="blocks list cannot be empty"):
+            Profile.from_dict({"blocks": []})
+        with pytest.raises(ValueError, match="positions must be a list"):
+            Profile.from_dict({"blocks": [{}], "positions": {}})
+    
+    def test_from_dict_reports_error_path(self):
+        """Test that type errors name the offending field's location."""
+        data = {"blocks": [{}, {"scheduled_events": [{"start": "soon"}]}]}
+        
+        with pytest.raises(ValueError, match=r"blocks\[1\]\.scheduled_events\[0\]\.start must be a number"):
+            Profile.from_dict(data)
+        with pytest.raises(ValueError, match=r"positions\[0\] must be an object"):
+            Profile.from_dict({"blocks": [{}], "positions": [3]})
+    
+    def test_from_dict_unknown_event_falls_back(self):
+        """Test that unknown non-auxiliary event names load as the first event type."""
+        data = {"blocks": [{"scheduled_events": [{"event": "Bogus"}, {"event": "Relay Off"}]}]}
+        
+        events = Profile.from_dict(data).blocks[0].scheduled_events
+        
+        assert events[0].event == EVENTS[0]
+        assert events[1].event == "Relay Off"
@@ -0,0 +1,180 @@
+"""Unit tests for pico_serial module."""
+
+import queue
+import threading
+
+import pytest
+from pc_app.pico_serial import PicoLink
+
+
+class FakeSerial:
+    """In-memory stand-in for serial.Serial that replies like the firmware."""
+
+    def __init__(self, replies=None):
+        self.is_open = True
+        self.timeout = 0.5
+        self.written = []
+        self._lines = queue.Queue()
+        # Lines the fake Pico sends back for each command word
+        self._replies = replies or {}
+
+    def feed(self, data: bytes):
+        """Queue raw bytes as lines sent by the Pico."""
+        for line in data.splitlines(keepends=True):
+            self._lines.put(line)
+
+    def readline(self):
+        if not self.is_open:
+            raise OSError("closed")
+        try:
+            return self._lines.get(timeout=0.05)
+        except queue.Empty:
+            return b""
+
+    def write(self, data):
+        data = bytes(data)
+        self.written.append(data)
+        word = data.split(b" ", 1)[0].strip()
+        if word in self._replies:
+            self.feed(self._replies[word])
+
+    def flush(self):
+        pass
+
+    def reset_input_buffer(self):
+        pass
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+class PutBinSerial(FakeSerial):
+    """FakeSerial that answers a PUT_BIN header with a delayed READY, like the firmware."""
+
+    def __init__(self, ready=b"READY\n", delay_s=0.1):
+        super().__init__()
+        self._ready = ready
+        self._delay_s = delay_s
+        self.ready_sent = False
+        self.early_payload = False      # Payload bytes written before READY was sent
+        self.payload = bytearray()
+        self._expected = 0
+
+    def _send_ready(self):
+        self.ready_sent = True
+        self.feed(self._ready)
+
+    def write(self, data):
+        data = bytes(data)
+        self.written.append(data)
+        if data.startswith(b"PUT_BIN "):
+            self._expected = int(data.split()[2])
+            threading.Timer(self._delay_s, self._send_ready).start()
+            return
+        if not self.ready_sent:
+            self.early_payload = True
+        self.payload += data
+        if len(self.payload) >= self._expected:
+            self.feed(b"OK PUT_BIN\n")
+
+
+@pytest.fixture
+def link_with():
+    """Return a factory for a PicoLink reading a FakeSerial through its reader thread."""
+    links = []
+
+    def make(replies):
+        link = PicoLink()
+        link.ser = replies if isinstance(replies, FakeSerial) else FakeSerial(replies)
+        link._reader = threading.Thread(target=link._reader_loop, args=(link.ser,), daemon=True)
+        link._reader.start()
+        links.append(link)
+        return link
+
+    yield make
+    for link in links:
+        link.close()
+
+
+class TestRunStatus:
+    """Tests for routing RUN replies and run status lines."""
+
+    def test_err_after_ok_run_reaches_wait_done(self, link_with):
+        """Test an ERR sent right after "OK RUN" is reported by wait_done()."""
+        link = link_with({b"RUN": b"OK RUN\nERR x\n"})
+        assert link.run("profile.bin") == "OK RUN"
+        assert link.wait_done(timeout_s=2.0) == "ERR x"
+
+    def test_ping_skips_lines_before_pong(self, link_with):
+        """Test PING still collects every line until PONG."""
+        link = link_with({b"PING": b"MicroPython boot\nPONG\n"})
+        assert link.ping() == "PONG"
+
+
+class TestWaitDone:
+    """Tests for wait_done() reading the status queue."""
+
+    def test_returns_done(self, link_with):
+        """Test wait_done() returns the DONE line, skipping other status lines."""
+        link = link_with({b"RUN": b"OK RUN\n"})
+        link.run("profile.bin")
+        link.ser.feed(b"progress 50%\nDONE DONE\n")
+        assert link.wait_done(timeout_s=2.0) == "DONE DONE"
+
+    def test_returns_err(self, link_with):
+        """Test wait_done() returns an ERR status line."""
+        link = link_with({b"RUN": b"OK RUN\n"})
+        link.run("profile.bin")
+        link.ser.feed(b"ERR disk full\n")
+        assert link.wait_done(timeout_s=2.0) == "ERR disk full"
+
+    def test_timeout(self, link_with):
+        """Test wait_done() reports a timeout when no DONE arrives."""
+        link = link_with({b"RUN": b"OK RUN\n"})
+        link.run("profile.bin")
+        assert link.wait_done(timeout_s=0.2) == "ERR timeout waiting for DONE"
+
+    def test_done_during_command_reaches_status_queue(self, link_with):
+        """Test a DONE arriving while a command awaits its reply is not taken as the reply."""
+        link = link_with({b"RUN": b"OK RUN\n", b"PAUSE": b"DONE DONE\nOK PAUSE\n"})
+        link.run("profile.bin")
+        assert link.pause() == "OK PAUSE"
+        assert link.wait_done(timeout_s=2.0) == "DONE DONE"
+
+
+class TestPut:
+    """Tests for uploading files with PUT/PUT_BIN."""
+
+    def test_small_payload_single_write(self, link_with):
+        """Test a small payload is sent with its header in one write."""
+        link = link_with({b"PUT": b"OK PUT\n"})
+        assert link.put_json("a.json", '{"x": 1}') == "OK PUT"
+        assert link.ser.written == [b'PUT a.json 8\n{"x": 1}']
+
+    def test_large_payload_chunks(self, link_with):
+        """Test a large payload is sent as header plus PUT_CHUNK_SIZE chunks."""
+        link = link_with(PutBinSerial(delay_s=0.0))
+        data = bytearray(range(256)) * 40
+        assert link.put_bin("p.bin", data) == "OK PUT_BIN"
+        header = f"PUT_BIN p.bin {len(data)}\n".encode()
+        assert link.ser.written[0] == header
+        assert b"".join(link.ser.written[1:]) == bytes(data)
+        assert all(len(w) <= PicoLink.PUT_CHUNK_SIZE for w in link.ser.written[1:])
+
+    def test_put_bin_payload_waits_for_ready(self, link_with):
+        """Test PUT_BIN data (which may contain 0x03) is only written after READY."""
+        link = link_with(PutBinSerial(delay_s=0.2))
+        data = b"PBEV\x03\x00\x00\x00" * 4
+        assert link.put_bin("p.bin", data) == "OK PUT_BIN"
+        assert not link.ser.early_payload
+        assert link.ser.written[0] == f"PUT_BIN p.bin {len(data)}\n".encode()
+        assert bytes(link.ser.payload) == data
+
+    def test_put_bin_error_sends_no_payload(self, link_with):
+        """Test a PUT_BIN header answered with ERR returns it without sending data."""
+        link = link_with(PutBinSerial(ready=b"ERR no space\n", delay_s=0.0))
+        assert link.put_bin("p.bin", b"\x03" * 8) == "ERR no space"
+        assert link.ser.written == [b"PUT_BIN p.bin 8\n"]
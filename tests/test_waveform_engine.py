@@ -5,10 +5,31 @@ from pc_app.models import ScheduledEvent, Block
 from pc_app.waveform_engine import (
     build_waveforms_from_schedule,
     build_waveforms_from_blocks,
-    build_preview_channels
+    build_preview_channels,
+    build_digital_step_waveform,
+    state_last_start_wins,
+    shift_step_points,
+    WaveformBuf,
 )
 
 
+class TestBuildDigitalStepWaveform:
+    """Tests for the boundary sweep in build_digital_step_waveform."""
+    
+    def test_matches_last_start_wins(self):
+        """Test that every sampled state agrees with state_last_start_wins."""
+        # Overlaps, a nested block, an empty block and two blocks starting together
+        blocks = [(0.0, 100.0, 1), (20.0, 40.0, 0), (30.0, 30.0, 1), (60.0, 90.0, 0), (60.0, 80.0, 1)]
+        boundaries = [0.0, 20.0, 30.0, 40.0, 60.0, 80.0, 90.0, 100.0, 120.0]
+        
+        points = build_digital_step_waveform(blocks, boundaries)
+        
+        for t, state in points:
+            assert state == state_last_start_wins(t, blocks)
+        assert points[0] == (0.0, 1)
+        assert points[-1] == (120.0, 0)
+
+
 class TestBuildWaveformsFromSchedule:
     """Tests for single schedule waveform generation."""
     
@@ -110,6 +131,20 @@ class TestBuildWaveformsFromBlocks:
             build_waveforms_from_blocks([], "ms")
 
 
+class TestShiftStepPoints:
+    """Tests for shifting digital waveforms."""
+    
+    def test_list_and_buffer_agree(self):
+        """Test that a point list and a WaveformBuf shift identically."""
+        points = [(0.0, 0), (10.0, 1), (20.0, 0)]
+        buf = WaveformBuf.from_points(points, "int8")
+        
+        for src in (points, buf):
+            times, states = shift_step_points(src, 50.0)
+            assert times.tolist() == [50.0, 60.0, 70.0]
+            assert states.tolist() == [0, 1, 0]
+
+
 class TestBuildPreviewChannels:
     """Tests for preview channel generation."""
     